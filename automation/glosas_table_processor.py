@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import sqlite3
 from typing import List, Dict, Optional, Tuple
 from playwright.async_api import Page
 from database.db_manager_glosas import DatabaseManagerGlosas
@@ -165,28 +166,38 @@ class ProcesadorTablaGlosas:
             
             self._registrar_estado(f"💾 Guardando {len(todos_los_datos)} cuentas en base de datos...")
             
+            # Crear/actualizar todas las cuentas en una sola transacción;
+            # solo quedan PENDIENTE las que deben procesarse
+            try:
+                guardadas = self.db_manager.upsert_cuentas_bulk(todos_los_datos)
+            except (sqlite3.Error, KeyError) as e:
+                # Una fila inválida no debe perder toda la importación:
+                # se guarda cuenta por cuenta
+                self._registrar_estado(f"⚠️ Error guardando cuentas en bloque, se guardan una a una: {e}", "warning")
+                guardadas = {}
+
             for i, datos_fila in enumerate(todos_los_datos):
-                idcuenta = datos_fila['idcuenta']
-                
+                idcuenta = datos_fila.get('idcuenta')
                 try:
-                    # Verificar si debe procesarse esta cuenta
-                    if self.db_manager.should_process_cuenta(idcuenta):
-                        # Crear/actualizar registro en BD
-                        cuenta_id = self.db_manager.create_or_update_cuenta(datos_fila)
-                        
-                        # Agregar a lista de procesamiento
-                        datos_fila['cuenta_bd_id'] = cuenta_id
-                        cuentas_para_procesar.append(datos_fila)
-                        
-                        if i % 10 == 0 or i < 5:  # Log cada 10 cuentas o las primeras 5
-                            self._registrar_estado(f"💾 Cuenta {idcuenta} guardada en BD - ID: {cuenta_id}")
-                    else:
-                        cuentas_saltadas += 1
-                        if cuentas_saltadas <= 5:  # Log solo las primeras 5 saltadas
-                            self._registrar_estado(f"⏭️ Cuenta {idcuenta} saltada por estado")
+                    guardada = guardadas.get(idcuenta)
+                    if guardada is None:
+                        guardada = self.db_manager.upsert_cuenta(datos_fila)
+                    cuenta_id, estado = guardada
                 except Exception as e:
                     self._registrar_estado(f"❌ Error procesando cuenta {idcuenta}: {e}", "error")
                     continue
+
+                if estado == EstadoCuenta.PENDIENTE:
+                    # Agregar a lista de procesamiento
+                    datos_fila['cuenta_bd_id'] = cuenta_id
+                    cuentas_para_procesar.append(datos_fila)
+                    
+                    if i % 10 == 0 or i < 5:  # Log cada 10 cuentas o las primeras 5
+                        self._registrar_estado(f"💾 Cuenta {idcuenta} guardada en BD - ID: {cuenta_id}")
+                else:
+                    cuentas_saltadas += 1
+                    if cuentas_saltadas <= 5:  # Log solo las primeras 5 saltadas
+                        self._registrar_estado(f"⏭️ Cuenta {idcuenta} saltada por estado")
             
             self._registrar_estado("-"*50)
             self._registrar_estado(f"📊 PASO 1 COMPLETADO:")
@@ -482,8 +482,8 @@ class ProcesadorCompletoGlosasImplementado:
 
                         # ✅ USAR SOLO EL MÉTODO ÚNICO
                         try:
-                            if self.db_manager.should_process_cuenta(cuenta_data['idcuenta']):
-                                cuenta_bd_id = self.db_manager.create_or_update_cuenta(cuenta_data)
+                            cuenta_bd_id, estado = self.db_manager.upsert_cuenta(cuenta_data)
+                            if estado == EstadoCuenta.PENDIENTE:
                                 cuenta_data['bd_id'] = cuenta_bd_id
                                 cuentas.append(cuenta_data)
 
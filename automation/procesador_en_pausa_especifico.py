@@ -358,22 +358,20 @@ class ProcesadorEnPausaEspecifico:
 
             for cuenta in cuentas_extraidas:
                 try:
-                    # ✅ VERIFICAR si ya existe para evitar duplicados
-                    if self.db_manager.should_process_cuenta(cuenta['idcuenta']):
-
-                        # ✅ USAR el método correcto del db_manager
-                        cuenta_data = {
-                            'idcuenta': cuenta['idcuenta'],
-                            'proveedor': cuenta['proveedor'],
-                            'valor_glosado': self._parsear_moneda(cuenta['valor_glosado']),
-                            'fecha_radicacion': cuenta['fecha_radicacion'],
-                            'numero_radicacion': '',  # Completar si tienes este dato
-                            'numero_factura': '',     # Completar si tienes este dato  
-                            'fecha_factura': '',      # Completar si tienes este dato
-                            'valor_factura': 0.0      # Completar si tienes este dato
-                        }
+                    cuenta_data = {
+                        'idcuenta': cuenta['idcuenta'],
+                        'proveedor': cuenta['proveedor'],
+                        'valor_glosado': self._parsear_moneda(cuenta['valor_glosado']),
+                        'fecha_radicacion': cuenta['fecha_radicacion'],
+                        'numero_radicacion': '',  # Completar si tienes este dato
+                        'numero_factura': '',     # Completar si tienes este dato  
+                        'fecha_factura': '',      # Completar si tienes este dato
+                        'valor_factura': 0.0      # Completar si tienes este dato
+                    }
 
-                        cuenta_bd_id = self.db_manager.create_or_update_cuenta(cuenta_data)
+                    # ✅ UPSERT: las cuentas ya en proceso o completadas no se tocan
+                    cuenta_bd_id, estado = self.db_manager.upsert_cuenta(cuenta_data)
+                    if estado == EstadoCuenta.PENDIENTE:
                         cuentas_guardadas += 1
 
                         if cuentas_guardadas <= 5:  # Log solo primeras 5
@@ -238,11 +238,9 @@ class ProcesadorTablaGlosas:
                 idcuenta = datos_fila['idcuenta']
                 
                 try:
-                    # Verificar si debe procesarse esta cuenta
-                    if self.db_manager.should_process_cuenta(idcuenta):
-                        # Crear/actualizar registro en BD
-                        cuenta_id = self.db_manager.create_or_update_cuenta(datos_fila)
-                        
+                    # Crear/actualizar registro en BD; solo queda PENDIENTE si debe procesarse
+                    cuenta_id, estado = self.db_manager.upsert_cuenta(datos_fila)
+                    if estado == EstadoCuenta.PENDIENTE:
                         # Marcar como completado (procesamiento simplificado)
                         self.db_manager.update_cuenta_estado(
                             idcuenta, 
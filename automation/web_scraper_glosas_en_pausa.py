@@ -409,9 +409,8 @@ class WebScraperGlosasEnPausa:
             for cuenta_data in todas_las_cuentas:
                 idcuenta = cuenta_data['idcuenta']
 
-                if self.db_manager.should_process_cuenta(idcuenta):
-                    cuenta_bd_id = self.db_manager.create_or_update_cuenta(cuenta_data)
-
+                cuenta_bd_id, estado = self.db_manager.upsert_cuenta(cuenta_data)
+                if estado == EstadoCuenta.PENDIENTE:
                     # Marcar como EN_PROCESO para EN PAUSA
                     self.db_manager.update_cuenta_estado(
                         idcuenta, 
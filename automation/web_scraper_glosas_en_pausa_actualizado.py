@@ -13,6 +13,34 @@ from database.db_manager_glosas import DatabaseManagerGlosas
 from database.models_glosas import EstadoCuenta
 from config.settings import Settings
 
+# Consultas SQL de uso frecuente: texto constante para que sqlite3 reutilice
+# la sentencia preparada desde su caché interna en cada ejecución.
+_SQL_CUENTAS_EN_PAUSA = """
+    SELECT idcuenta, proveedor, estado, valor_glosado, 
+           fecha_radicacion, COALESCE(intentos, 0) as intentos
+    FROM cuenta_glosas_principal 
+    WHERE estado IN ('FALLIDO', 'EN_PROCESO') 
+    AND COALESCE(intentos, 0) < 5
+    ORDER BY intentos ASC, created_at ASC
+"""
+
+_SQL_CUENTA_EN_PAUSA_POR_ID = """
+    SELECT idcuenta, proveedor, estado, valor_glosado, 
+           fecha_radicacion, COALESCE(intentos, 0) as intentos
+    FROM cuenta_glosas_principal 
+    WHERE idcuenta = ?
+"""
+
+_SQL_ESTADISTICAS_BD = """
+    SELECT 
+        estado,
+        COUNT(*) as count,
+        AVG(COALESCE(intentos, 0)) as promedio_intentos,
+        MAX(COALESCE(intentos, 0)) as max_intentos
+    FROM cuenta_glosas_principal 
+    GROUP BY estado
+"""
+
 class WebScraperGlosasEnPausaActualizado:
     """
     Automatizador específico para gestión de glosas EN PAUSA.
@@ -72,6 +100,8 @@ class WebScraperGlosasEnPausaActualizado:
         
         if level == "info":
             self.logger.info(full_message)
+        elif level == "debug":
+            self.logger.debug(full_message)
         elif level == "warning":
             self.logger.warning(full_message)
         elif level == "error":
@@ -220,19 +250,20 @@ class WebScraperGlosasEnPausaActualizado:
                 action="ETAPA 3: Procesamiento con herencia completa"
             )
             
-            self._log_state("⚙️ ETAPA 3: PROCESAMIENTO CON HERENCIA COMPLETA")
-            self._log_state("-"*50)
-            self._log_state("🎯 FUNCIONALIDADES HEREDADAS:")
-            self._log_state("   ✅ Lógica completa de procesamiento de glosas")
-            self._log_state("   ✅ Manejo de modales y respuestas automáticas")
-            self._log_state("   ✅ Sistema de configuraciones de BD")
-            self._log_state("   ✅ Manejo de errores y estados")
-            self._log_state("   ✅ Finalización de cuentas")
-            self._log_state("🔄 FUNCIONALIDADES ADAPTADAS:")
-            self._log_state("   • Navegación específica a EN PAUSA")
-            self._log_state("   • Control de intentos (máximo 5)")
-            self._log_state("   • URLs adaptadas para EN PAUSA")
-            self._log_state("-"*50)
+            # Banner descriptivo: solo visible en DEBUG
+            self._log_state("⚙️ ETAPA 3: PROCESAMIENTO CON HERENCIA COMPLETA", "debug")
+            self._log_state("-"*50, "debug")
+            self._log_state("🎯 FUNCIONALIDADES HEREDADAS:", "debug")
+            self._log_state("   ✅ Lógica completa de procesamiento de glosas", "debug")
+            self._log_state("   ✅ Manejo de modales y respuestas automáticas", "debug")
+            self._log_state("   ✅ Sistema de configuraciones de BD", "debug")
+            self._log_state("   ✅ Manejo de errores y estados", "debug")
+            self._log_state("   ✅ Finalización de cuentas", "debug")
+            self._log_state("🔄 FUNCIONALIDADES ADAPTADAS:", "debug")
+            self._log_state("   • Navegación específica a EN PAUSA", "debug")
+            self._log_state("   • Control de intentos (máximo 5)", "debug")
+            self._log_state("   • URLs adaptadas para EN PAUSA", "debug")
+            self._log_state("-"*50, "debug")
             
             # Obtener cuentas EN PAUSA específicas
             cuentas_en_pausa = await self._obtener_cuentas_en_pausa()
@@ -241,10 +272,10 @@ class WebScraperGlosasEnPausaActualizado:
                 self._log_state("⚠️ No hay cuentas EN PAUSA para reprocesar", "warning")
                 return False
             
-            # Emitir signal de importación de datos
+            # Emitir signal de importación de datos (conexión encolada: la UI
+            # lo atiende en su propio hilo, no hace falta esperar aquí)
             if self.worker:
                 self.worker.emit_data_imported(len(cuentas_en_pausa))
-                await asyncio.sleep(1)
             
             # ✅ INICIALIZAR PROCESADOR ESPECÍFICO PARA EN PAUSA
             self.procesador_en_pausa = ProcesadorEnPausaEspecifico(
@@ -254,8 +285,8 @@ class WebScraperGlosasEnPausaActualizado:
             )
             
             self._log_state(f"🚀 Iniciando reprocesamiento HEREDADO de {len(cuentas_en_pausa)} cuentas EN PAUSA")
-            self._log_state("✅ Procesador: ProcesadorEnPausaEspecifico")
-            self._log_state("✅ Funcionalidad: 100% heredada + navegación adaptada")
+            self._log_state("✅ Procesador: ProcesadorEnPausaEspecifico", "debug")
+            self._log_state("✅ Funcionalidad: 100% heredada + navegación adaptada", "debug")
             
             # ✅ USAR MÉTODO ESPECÍFICO DEL PROCESADOR HEREDADO
             cuentas_recuperadas, cuentas_fallidas = await self.procesador_en_pausa.procesar_cuentas_en_pausa(cuentas_en_pausa)
@@ -265,7 +296,7 @@ class WebScraperGlosasEnPausaActualizado:
             self.estadisticas_globales['total_cuentas_recuperadas'] = cuentas_recuperadas
             self.estadisticas_globales['total_cuentas_fallidas'] = cuentas_fallidas
             
-            self._log_state("-"*50)
+            self._log_state("-"*50, "debug")
             self._log_state("📊 RESULTADOS DE PROCESAMIENTO HEREDADO:")
             self._log_state(f"   • Cuentas recuperadas: {cuentas_recuperadas}")
             self._log_state(f"   • Cuentas que siguen fallando: {cuentas_fallidas}")
@@ -276,7 +307,7 @@ class WebScraperGlosasEnPausaActualizado:
                 return False
             
             self._log_state("✅ ETAPA 3 COMPLETADA: Procesamiento heredado terminado")
-            self._log_state("-"*50)
+            self._log_state("-"*50, "debug")
             return True
             
         except Exception as e:
@@ -291,31 +322,12 @@ class WebScraperGlosasEnPausaActualizado:
         try:
             self._log_state("📋 Obteniendo cuentas EN PAUSA para reprocesamiento con herencia")
             
-            # Buscar en BD primero
+            # Buscar en BD primero (en un hilo aparte para no bloquear el event loop)
             cuentas_bd_en_pausa = []
             
             try:
-                with self.db_manager.get_connection() as conn:
-                    cursor = conn.execute("""
-                        SELECT idcuenta, proveedor, estado, valor_glosado, 
-                               fecha_radicacion, COALESCE(intentos, 0) as intentos
-                        FROM cuenta_glosas_principal 
-                        WHERE estado IN ('FALLIDO', 'EN_PROCESO') 
-                        AND COALESCE(intentos, 0) < 5
-                        ORDER BY intentos ASC, created_at ASC
-                    """)
-                    
-                    for row in cursor.fetchall():
-                        cuentas_bd_en_pausa.append({
-                            'idcuenta': row['idcuenta'],
-                            'proveedor': row['proveedor'],
-                            'estado': row['estado'],
-                            'valor_glosado': row['valor_glosado'],
-                            'fecha_radicacion': row['fecha_radicacion'],
-                            'intentos': row['intentos']
-                        })
-                    
-                    self._log_state(f"🔍 Encontradas {len(cuentas_bd_en_pausa)} cuentas EN PAUSA en BD")
+                cuentas_bd_en_pausa = await asyncio.to_thread(self._consultar_cuentas_en_pausa_sync)
+                self._log_state(f"🔍 Encontradas {len(cuentas_bd_en_pausa)} cuentas EN PAUSA en BD")
                     
             except Exception as e:
                 self._log_state(f"⚠️ Error consultando BD: {e}", "warning")
@@ -340,6 +352,26 @@ class WebScraperGlosasEnPausaActualizado:
             self._log_state(f"❌ Error obteniendo cuentas EN PAUSA: {e}", "error")
             return []
     
+    def _consultar_cuentas_en_pausa_sync(self) -> List[Dict]:
+        """
+        Consulta síncrona de cuentas EN PAUSA procesables en BD.
+        Se ejecuta vía asyncio.to_thread para no bloquear Playwright.
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute(_SQL_CUENTAS_EN_PAUSA)
+            
+            return [
+                {
+                    'idcuenta': row['idcuenta'],
+                    'proveedor': row['proveedor'],
+                    'estado': row['estado'],
+                    'valor_glosado': row['valor_glosado'],
+                    'fecha_radicacion': row['fecha_radicacion'],
+                    'intentos': row['intentos']
+                }
+                for row in cursor.fetchall()
+            ]
+    
     async def _obtener_cuentas_desde_tabla_en_pausa(self) -> List[Dict]:
         """
         ✅ CORREGIDO: Usa el método específico para EN PAUSA.
@@ -385,12 +417,7 @@ class WebScraperGlosasEnPausaActualizado:
                     if estado_actual in [EstadoCuenta.FALLIDO, EstadoCuenta.EN_PROCESO]:
                         # Obtener datos completos desde BD
                         with self.db_manager.get_connection() as conn:
-                            cursor = conn.execute("""
-                                SELECT idcuenta, proveedor, estado, valor_glosado, 
-                                       fecha_radicacion, COALESCE(intentos, 0) as intentos
-                                FROM cuenta_glosas_principal 
-                                WHERE idcuenta = ?
-                            """, (idcuenta,))
+                            cursor = conn.execute(_SQL_CUENTA_EN_PAUSA_POR_ID, (idcuenta,))
                             
                             row = cursor.fetchone()
                             if row and row['intentos'] < 5:
@@ -498,30 +525,26 @@ class WebScraperGlosasEnPausaActualizado:
     async def _mostrar_estadisticas_bd(self):
         """Muestra estadísticas finales desde la base de datos."""
         try:
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT 
-                        estado,
-                        COUNT(*) as count,
-                        AVG(COALESCE(intentos, 0)) as promedio_intentos,
-                        MAX(COALESCE(intentos, 0)) as max_intentos
-                    FROM cuenta_glosas_principal 
-                    GROUP BY estado
-                """)
-                
-                self._log_state("")
-                self._log_state("💾 ESTADÍSTICAS FINALES DESDE BASE DE DATOS (HERENCIA)")
-                self._log_state("-"*50)
-                
-                for row in cursor.fetchall():
-                    estado = row['estado']
-                    count = row['count']
-                    promedio = row['promedio_intentos']
-                    maximo = row['max_intentos']
-                    
-                    self._log_state(f"🏢 {estado}: {count} cuentas (promedio intentos: {promedio:.1f}, máx: {maximo})")
+            rows = await asyncio.to_thread(self._consultar_estadisticas_bd_sync)
+            
+            self._log_state("")
+            self._log_state("💾 ESTADÍSTICAS FINALES DESDE BASE DE DATOS (HERENCIA)")
+            self._log_state("-"*50)
+            
+            for row in rows:
+                estado = row['estado']
+                count = row['count']
+                promedio = row['promedio_intentos']
+                maximo = row['max_intentos']
                 
-                self._log_state("-"*50)
+                self._log_state(f"🏢 {estado}: {count} cuentas (promedio intentos: {promedio:.1f}, máx: {maximo})")
+            
+            self._log_state("-"*50)
                 
         except Exception as e:
-            self._log_state(f"❌ Error obteniendo estadísticas de BD: {e}", "error")
\ No newline at end of file
+            self._log_state(f"❌ Error obteniendo estadísticas de BD: {e}", "error")
+    
+    def _consultar_estadisticas_bd_sync(self) -> list:
+        """Consulta síncrona de estadísticas por estado (ejecutada vía asyncio.to_thread)."""
+        with self.db_manager.get_connection() as conn:
+            return conn.execute(_SQL_ESTADISTICAS_BD).fetchall()
\ No newline at end of file
@@ -5,8 +5,12 @@ Configuración de Playwright para ejecutable con navegador incluido.
 
 import os
 import sys
+import logging
+import functools
 from pathlib import Path
 
+_log = logging.getLogger(__name__)
+
 def setup_for_exe():
     """Configura Playwright para ejecutable con navegador incluido."""
     if getattr(sys, 'frozen', False):
@@ -26,23 +30,24 @@ def setup_for_exe():
             os.environ["PLAYWRIGHT_BROWSERS_PATH"] = str(playwright_browsers)
             os.environ["PLAYWRIGHT_SKIP_BROWSER_DOWNLOAD"] = "1"
             
-            print(f"✅ Playwright configurado con navegador embebido: {playwright_browsers}")
+            _log.debug("Playwright configurado con navegador embebido: %s", playwright_browsers)
         else:
-            print(f"⚠️ Navegadores no encontrados en: {playwright_browsers}")
             # Fallback: intentar usar navegador del sistema
-            print("🔄 Intentando usar navegador del sistema...")
+            _log.warning("Navegadores no encontrados en: %s - intentando usar navegador del sistema", playwright_browsers)
     else:
         # Modo desarrollo - usar configuración normal
-        print("🔧 Modo desarrollo - usando configuración estándar de Playwright")
+        _log.debug("Modo desarrollo - usando configuración estándar de Playwright")
+
+@functools.lru_cache(maxsize=1)
+def _playwright_version():
+    """Importa playwright una sola vez y devuelve su __version__ (o None)."""
+    import playwright
+    return getattr(playwright, "__version__", None)
 
 def verificar_playwright():
     """Verifica que Playwright esté funcionando."""
     try:
-        import playwright
-        try:
-            version = playwright.__version__
-        except AttributeError:
-            version = "versión desconocida"
+        version = _playwright_version() or "versión desconocida"
         print(f"✅ Playwright {version} importado correctamente")
         return True
     except ImportError as e:
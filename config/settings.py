@@ -1,5 +1,19 @@
 import os
 import sys
+import logging
+
+_log = logging.getLogger(__name__)
+
+class _RutaBaseDatosPerezosa:
+    """
+    Descriptor que resuelve la ruta de la BD en el primer acceso.
+    Tras calcularla se reemplaza por el valor, así el resto de accesos son directos.
+    """
+    
+    def __get__(self, instance, owner):
+        db_path = owner.get_database_path()
+        setattr(owner, 'DATABASE_PATH', db_path)
+        return db_path
 
 class Settings:
     """
@@ -18,19 +32,19 @@ class Settings:
         # Crear el directorio si no existe
         try:
             os.makedirs(db_dir, exist_ok=True)
-            print(f"✅ Directorio de BD verificado: {db_dir}")
+            _log.debug("Directorio de BD verificado: %s", db_dir)
         except Exception as e:
-            print(f"❌ Error creando directorio {db_dir}: {e}")
+            _log.warning("Error creando directorio %s: %s", db_dir, e)
             # Fallback: usar directorio actual
             db_dir = os.getcwd()
         
         db_path = os.path.join(db_dir, "bootgestor.db")
-        print(f"📂 Ruta de BD: {db_path}")
+        _log.debug("Ruta de BD: %s", db_path)
         return db_path
     
-    # Base de datos - USAR RUTA FIJA
+    # Base de datos - USAR RUTA FIJA (se resuelve en el primer acceso, no al importar)
     DATABASE_NAME = "bootgestor.db"
-    DATABASE_PATH = get_database_path.__func__()
+    DATABASE_PATH = _RutaBaseDatosPerezosa()
     
     # Configuración de logging
     LOG_LEVEL = "INFO"
@@ -15,6 +15,54 @@ import os
 from pathlib import Path
 import shutil
 import platform
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+# PyInstaller solo añade la extensión .exe en Windows
+EXE_NAME = "BootGestor.exe" if platform.system() == "Windows" else "BootGestor"
+EXE_PATH = Path("dist") / EXE_NAME
+
+# Importaciones críticas que PyInstaller no detecta por sí solo
+HIDDEN_IMPORTS = (
+    "playwright",
+    "playwright.sync_api",
+    "playwright.async_api",
+    "playwright._impl._api_structures",
+    "playwright._impl._transport",
+    "playwright._impl._browser_type",
+    
+    "PySide6.QtCore",
+    "PySide6.QtWidgets",
+    "PySide6.QtGui",
+    
+    "sqlite3",
+    "_sqlite3",
+    "asyncio",
+    "logging",
+    "json",
+    "datetime",
+    "pathlib",
+    "dataclasses",
+    "enum",
+    "typing",
+)
+
+# Paquetes que no usa la aplicación y que inflarían el ejecutable
+EXCLUDES = (
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "scipy",
+    "tkinter",
+    "PyQt5",
+    "PyQt6",
+)
+
+@functools.lru_cache(maxsize=1)
+def _playwright_version():
+    """Importa playwright una sola vez y devuelve su __version__ (o None)."""
+    import playwright
+    return getattr(playwright, "__version__", None)
 
 def verificar_sistema():
     """Verifica el sistema."""
@@ -31,12 +79,8 @@ def verificar_sistema():
     
     print(f"   Playwright: ", end="")
     try:
-        import playwright
         # Algunas versiones no tienen __version__
-        try:
-            version = playwright.__version__
-        except AttributeError:
-            version = "instalado (versión no disponible)"
+        version = _playwright_version() or "instalado (versión no disponible)"
         print(f"{version}")
     except ImportError:
         print("❌ No encontrado")
@@ -48,55 +92,112 @@ def instalar_navegador_playwright():
     """Instala el navegador Chromium para incluirlo en el ejecutable."""
     print("🎭 Instalando navegador Chromium...")
     
-    try:
-        # Instalar Chromium
-        resultado = subprocess.run([
-            sys.executable, "-m", "playwright", "install", "chromium"
-        ], check=True, capture_output=True, text=True)
-        
-        print("✅ Chromium instalado correctamente")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error instalando Chromium: {e}")
-        print(f"Salida: {e.stdout}")
-        print(f"Error: {e.stderr}")
+    comando = [sys.executable, "-m", "playwright", "install", "chromium"]
+    
+    # Se muestra la salida línea a línea en lugar de acumularla: la descarga
+    # tarda minutos y así se ve el progreso sin retener todo el log en memoria
+    with subprocess.Popen(
+        comando,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    ) as proceso:
+        for linea in proceso.stdout:
+            print(linea, end="")
+        codigo = proceso.wait()
+    
+    if codigo != 0:
+        print(f"❌ Error instalando Chromium: {subprocess.CalledProcessError(codigo, comando)}")
         return False
+    
+    print("✅ Chromium instalado correctamente")
+    return True
+
+def _buscar_carpeta_chromium(ubicacion):
+    """
+    Devuelve la primera carpeta chromium-* dentro de ubicacion, o None.
+    
+    os.scandir entrega el tipo de cada entrada sin un stat() adicional y
+    permite cortar en la primera coincidencia; si la ubicación no existe
+    se trata igual que una carpeta vacía.
+    """
+    try:
+        with os.scandir(ubicacion) as entradas:
+            for entrada in entradas:
+                if entrada.name.startswith("chromium-") and entrada.is_dir(follow_symlinks=False):
+                    return Path(entrada.path)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return None
 
 def encontrar_chromium_path():
     """Encuentra la ubicación del navegador Chromium instalado."""
     print("🔍 Buscando ubicación de Chromium...")
     
-    # Ubicaciones comunes de Playwright
-    posibles_ubicaciones = [
-        Path.home() / "AppData" / "Local" / "ms-playwright",
-        Path.home() / ".cache" / "ms-playwright",
-        Path(os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "")),
-    ]
+    # Si PLAYWRIGHT_BROWSERS_PATH está definida (lo habitual en CI), Playwright
+    # instala ahí y no hace falta probar otras rutas. Si no, solo se mira la
+    # ubicación por defecto del sistema actual.
+    env_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH")
+    if env_path:
+        ubicacion = Path(env_path)
+    elif platform.system() == "Windows":
+        ubicacion = Path.home() / "AppData" / "Local" / "ms-playwright"
+    elif platform.system() == "Darwin":
+        ubicacion = Path.home() / "Library" / "Caches" / "ms-playwright"
+    else:
+        ubicacion = Path.home() / ".cache" / "ms-playwright"
     
-    for ubicacion in posibles_ubicaciones:
-        if ubicacion.exists():
-            # Buscar carpeta chromium
-            chromium_dirs = list(ubicacion.glob("chromium-*"))
-            if chromium_dirs:
-                chromium_path = chromium_dirs[0]
-                print(f"✅ Chromium encontrado en: {chromium_path}")
-                return chromium_path
+    chromium_path = _buscar_carpeta_chromium(ubicacion)
+    if chromium_path:
+        print(f"✅ Chromium encontrado en: {chromium_path}")
+        return chromium_path
     
     print("❌ No se encontró Chromium instalado")
     return None
 
+def _eliminar_directorio(dir_name):
+    """
+    Elimina un árbol de directorios delegando en el sistema operativo.
+    
+    Un solo proceso rd/rm borra build/ (miles de archivos tras PyInstaller)
+    mucho más rápido que shutil.rmtree entrada por entrada. Si la
+    herramienta no está disponible o deja restos, se recurre a shutil.
+    """
+    if platform.system() == "Windows":
+        comando = ["cmd", "/c", "rd", "/s", "/q", dir_name]
+    else:
+        comando = ["rm", "-rf", dir_name]
+    
+    try:
+        subprocess.run(comando, check=False)
+    except OSError:
+        pass
+    
+    if Path(dir_name).exists():
+        shutil.rmtree(dir_name)
+
 def limpiar_builds():
     """Limpia builds anteriores."""
     print("🗑️ Limpiando builds anteriores...")
     
-    for dir_name in ["build", "dist", "__pycache__"]:
-        if Path(dir_name).exists():
-            shutil.rmtree(dir_name)
-            print(f"   Eliminado: {dir_name}")
+    directorios = [d for d in ("build", "dist", "__pycache__") if Path(d).exists()]
     
-    for spec_file in Path(".").glob("*.spec"):
-        spec_file.unlink()
-        print(f"   Eliminado: {spec_file}")
+    # Solo el directorio actual: scandir ya trae el tipo de cada entrada
+    with os.scandir(".") as entradas:
+        spec_files = [
+            entrada.name for entrada in entradas
+            if entrada.name.endswith(".spec") and entrada.is_file(follow_symlinks=False)
+        ]
+    
+    # Los árboles son independientes y el borrado es I/O puro (el GIL se
+    # libera en cada syscall), así que se eliminan en paralelo
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_eliminar_directorio, directorios))
+        list(executor.map(os.unlink, spec_files))
+    
+    for eliminado in [*directorios, *spec_files]:
+        print(f"   Eliminado: {eliminado}")
 
 def crear_config_playwright():
     """Crea configuración especial de Playwright para el ejecutable."""
@@ -116,8 +217,12 @@ Configuración de Playwright para ejecutable con navegador incluido.
 
 import os
 import sys
+import logging
+import functools
 from pathlib import Path
 
+_log = logging.getLogger(__name__)
+
 def setup_for_exe():
     """Configura Playwright para ejecutable con navegador incluido."""
     if getattr(sys, 'frozen', False):
@@ -137,23 +242,24 @@ def setup_for_exe():
             os.environ["PLAYWRIGHT_BROWSERS_PATH"] = str(playwright_browsers)
             os.environ["PLAYWRIGHT_SKIP_BROWSER_DOWNLOAD"] = "1"
             
-            print(f"✅ Playwright configurado con navegador embebido: {playwright_browsers}")
+            _log.debug("Playwright configurado con navegador embebido: %s", playwright_browsers)
         else:
-            print(f"⚠️ Navegadores no encontrados en: {playwright_browsers}")
             # Fallback: intentar usar navegador del sistema
-            print("🔄 Intentando usar navegador del sistema...")
+            _log.warning("Navegadores no encontrados en: %s - intentando usar navegador del sistema", playwright_browsers)
     else:
         # Modo desarrollo - usar configuración normal
-        print("🔧 Modo desarrollo - usando configuración estándar de Playwright")
+        _log.debug("Modo desarrollo - usando configuración estándar de Playwright")
+
+@functools.lru_cache(maxsize=1)
+def _playwright_version():
+    """Importa playwright una sola vez y devuelve su __version__ (o None)."""
+    import playwright
+    return getattr(playwright, "__version__", None)
 
 def verificar_playwright():
     """Verifica que Playwright esté funcionando."""
     try:
-        import playwright
-        try:
-            version = playwright.__version__
-        except AttributeError:
-            version = "versión desconocida"
+        version = _playwright_version() or "versión desconocida"
         print(f"✅ Playwright {version} importado correctamente")
         return True
     except ImportError as e:
@@ -162,8 +268,7 @@ def verificar_playwright():
 '''
     
     config_file = config_dir / "playwright_exe_config.py"
-    with open(config_file, 'w', encoding='utf-8') as f:
-        f.write(config_content)
+    config_file.write_bytes(config_content.encode("utf-8"))
     
     print(f"✅ Configuración creada: {config_file}")
     return config_file
@@ -177,10 +282,8 @@ def crear_ejecutable_con_navegador():
     if not chromium_path:
         return False
     
-    # Comando de PyInstaller con navegador incluido
+    # Argumentos de PyInstaller con navegador incluido
     comando = [
-        sys.executable, "-m", "PyInstaller",
-        
         # Configuración básica
         "--onefile",
         "--windowed", 
@@ -193,74 +296,57 @@ def crear_ejecutable_con_navegador():
         
         # Incluir archivos de proyecto
         "--add-data=config;config",
-        *(["--add-data=contrato.pdf;."] if Path("contrato.pdf").exists() else []),
-        
-        # Importaciones críticas
-        "--hidden-import=playwright",
-        "--hidden-import=playwright.sync_api",
-        "--hidden-import=playwright.async_api",
-        "--hidden-import=playwright._impl._api_structures",
-        "--hidden-import=playwright._impl._transport",
-        "--hidden-import=playwright._impl._browser_type",
-        
-        "--hidden-import=PySide6.QtCore",
-        "--hidden-import=PySide6.QtWidgets",
-        "--hidden-import=PySide6.QtGui",
-        
-        "--hidden-import=sqlite3",
-        "--hidden-import=_sqlite3", 
-        "--hidden-import=asyncio",
-        "--hidden-import=logging",
-        "--hidden-import=json",
-        "--hidden-import=datetime",
-        "--hidden-import=pathlib",
-        "--hidden-import=dataclasses",
-        "--hidden-import=enum",
-        "--hidden-import=typing",
-        
-        # Exclusiones
-        "--exclude-module=matplotlib",
-        "--exclude-module=numpy",
-        "--exclude-module=pandas",
-        "--exclude-module=scipy",
-        "--exclude-module=tkinter",
-        "--exclude-module=PyQt5",
-        "--exclude-module=PyQt6",
-        
-        "--name=BootGestor",
-        "main.py"
     ]
     
+    if Path("contrato.pdf").exists():
+        comando.append("--add-data=contrato.pdf;.")
+    
+    comando += [f"--hidden-import={modulo}" for modulo in HIDDEN_IMPORTS]
+    comando += [f"--exclude-module={modulo}" for modulo in EXCLUDES]
+    comando += ["--name=BootGestor", "main.py"]
+    
     print("📦 Ejecutando PyInstaller con navegador incluido...")
     print("⏳ ADVERTENCIA: Esto tardará MUCHO tiempo (navegador es ~200MB)")
     
+    # PyInstaller se ejecuta en este mismo proceso: evita arrancar otro
+    # intérprete y volver a importar PyInstaller y sus hooks
     try:
-        resultado = subprocess.run(comando, check=True)
-        print("✅ Ejecutable con navegador creado exitosamente")
-        return True
-    except subprocess.CalledProcessError as e:
+        import PyInstaller.__main__
+        PyInstaller.__main__.run(comando)
+    except SystemExit as e:
+        # PyInstaller termina con sys.exit() cuando falla
+        if e.code not in (None, 0):
+            print(f"❌ Error creando ejecutable: PyInstaller terminó con código {e.code}")
+            return False
+    except Exception as e:
         print(f"❌ Error creando ejecutable: {e}")
         return False
+    
+    print("✅ Ejecutable con navegador creado exitosamente")
+    return True
 
 def verificar_ejecutable():
     """Verifica el ejecutable creado."""
-    exe_path = Path("dist/BootGestor.exe")
+    exe_path = EXE_PATH
     
-    if exe_path.exists():
-        size_mb = exe_path.stat().st_size / (1024 * 1024)
-        print(f"✅ Ejecutable creado: {exe_path}")
-        print(f"📏 Tamaño: {size_mb:.1f} MB")
-        
-        if size_mb < 100:
-            print("⚠️ Tamaño sospechosamente pequeño - el navegador podría no estar incluido")
-        else:
-            print("✅ Tamaño correcto - navegador probablemente incluido")
-        
-        crear_script_prueba()
-        return True
-    else:
+    # Un único stat sirve a la vez de comprobación de existencia y de tamaño
+    try:
+        st = os.stat(exe_path)
+    except FileNotFoundError:
         print("❌ Ejecutable no encontrado")
         return False
+    
+    size_mb = st.st_size / (1024 * 1024)
+    print(f"✅ Ejecutable creado: {exe_path}")
+    print(f"📏 Tamaño: {size_mb:.1f} MB")
+    
+    if size_mb < 100:
+        print("⚠️ Tamaño sospechosamente pequeño - el navegador podría no estar incluido")
+    else:
+        print("✅ Tamaño correcto - navegador probablemente incluido")
+    
+    crear_script_prueba()
+    return True
 
 def crear_script_prueba():
     """Crea script de prueba mejorado."""
@@ -307,8 +393,10 @@ echo.
 pause
 '''
     
-    with open("dist/Probar_BootGestor.bat", 'w', encoding='utf-8') as f:
-        f.write(test_content)
+    # cmd.exe espera finales de línea CRLF en los .bat
+    Path("dist/Probar_BootGestor.bat").write_bytes(
+        test_content.replace("\n", "\r\n").encode("utf-8")
+    )
     
     print("✅ Script de prueba creado")
 
@@ -319,7 +407,7 @@ def mostrar_resultado():
     print("="*70)
     print()
     print("📁 ARCHIVOS:")
-    print("   • dist/BootGestor.exe (incluye navegador Chromium)")
+    print(f"   • {EXE_PATH.as_posix()} (incluye navegador Chromium)")
     print("   • dist/Probar_BootGestor.bat")
     print()
     print("📦 CARACTERÍSTICAS:")
@@ -329,7 +417,7 @@ def mostrar_resultado():
     print("   ⚠️ Tamaño grande (~300-400MB)")
     print()
     print("🚀 DISTRIBUCIÓN:")
-    print("   • Envía solo BootGestor.exe")
+    print(f"   • Envía solo {EXE_NAME}")
     print("   • Funciona sin instalaciones adicionales")
     print("   • Primera ejecución puede tardar 30 segundos")
     print()
@@ -376,7 +464,7 @@ def main():
     if respuesta in ['s', 'si', 'y', 'yes']:
         try:
             print("🚀 Iniciando BootGestor...")
-            subprocess.Popen([str(Path("dist/BootGestor.exe"))])
+            subprocess.Popen([str(EXE_PATH)])
             print("✅ BootGestor iniciado (puede tardar en aparecer)")
         except Exception as e:
             print(f"❌ Error: {e}")
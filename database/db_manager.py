@@ -1,8 +1,108 @@
 import sqlite3
 import logging
-from typing import List, Optional
+import threading
+import functools
+from typing import Any, Callable, Iterable, Iterator, List, Optional
 from config.settings import Settings
-from database.models import Cliente
+from database.models import Cliente, ClienteRow
+
+# Versión del esquema guardada en PRAGMA user_version. Incrementarla al
+# cambiar CREATE_ALL_SQL para que create_tables vuelva a ejecutarse.
+SCHEMA_VERSION = 2
+
+CREATE_ALL_SQL = """
+    -- Tabla clientes
+    CREATE TABLE IF NOT EXISTS cliente (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nombre TEXT NOT NULL,
+        nit TEXT UNIQUE NOT NULL,
+        correo TEXT,
+        telefono TEXT
+    );
+    
+    -- Índice para listar clientes ordenados por nombre sin ordenar en memoria.
+    -- Con la intercalación BINARY de siempre (mayúsculas antes que
+    -- minúsculas); se recrea por si quedó la versión COLLATE NOCASE
+    DROP INDEX IF EXISTS idx_cliente_nombre;
+    CREATE INDEX idx_cliente_nombre
+    ON cliente(nombre);
+    
+    -- Tabla para logs de automatización (opcional)
+    CREATE TABLE IF NOT EXISTS automation_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        action TEXT NOT NULL,
+        status TEXT NOT NULL,
+        details TEXT
+    );
+"""
+
+# Sentencias CRUD como constantes de módulo: el mismo objeto str en cada
+# llamada, así la caché de sentencias de la conexión (cached_statements)
+# las encuentra ya compiladas y SQLite no vuelve a parsearlas.
+_SQL_INSERT_CLIENT = """
+    INSERT INTO cliente (nombre, nit, correo, telefono)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_SELECT_CLIENTS = """
+    SELECT id, nombre, nit, correo, telefono
+    FROM cliente
+    ORDER BY nombre
+"""
+
+_SQL_COUNT_CLIENTS = "SELECT COUNT(*) FROM cliente"
+
+_SQL_UPDATE_CLIENT = """
+    UPDATE cliente
+    SET nombre=?, nit=?, correo=?, telefono=?
+    WHERE id=?
+"""
+
+_SQL_DELETE_CLIENT = "DELETE FROM cliente WHERE id=?"
+
+# SQLite >= 3.35 admite RETURNING: la propia sentencia devuelve la fila
+# afectada y no hace falta consultar rowcount después
+_SOPORTA_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+if _SOPORTA_RETURNING:
+    _SQL_UPDATE_CLIENT += "    RETURNING id\n"
+    _SQL_DELETE_CLIENT += " RETURNING id"
+
+def _cliente_row_factory(cursor: sqlite3.Cursor, row: tuple) -> ClienteRow:
+    """row_factory para _SQL_SELECT_CLIENTS: envuelve la tupla sin copiar campos."""
+    return ClienteRow(row)
+
+# Tamaño de la caché de sentencias preparadas por conexión
+_CACHED_STATEMENTS = 256
+
+def _sqlite_guard(mensaje: str, default: Optional[Callable[[], Any]] = None):
+    """
+    Decorador para los métodos CRUD de DatabaseManager.
+    
+    Ejecuta el método con el lock de la conexión tomado. Si lanza
+    sqlite3.Error deshace la transacción en curso, registra
+    "<mensaje>: <error>" y relanza la excepción, o devuelve default() si
+    se indicó un valor por defecto.
+    
+    Args:
+        mensaje (str): Prefijo del mensaje de error
+        default (Callable, optional): Fábrica del valor a devolver en caso de error
+    """
+    def decorador(metodo):
+        @functools.wraps(metodo)
+        def envoltura(self, *args, **kwargs):
+            with self._lock:
+                try:
+                    return metodo(self, *args, **kwargs)
+                except sqlite3.Error as e:
+                    self.get_connection().rollback()
+                    self.logger.error(f"{mensaje}: {e}")
+                    if default is None:
+                        raise
+                    return default()
+        return envoltura
+    return decorador
 
 class DatabaseManager:
     """
@@ -10,55 +110,117 @@ class DatabaseManager:
     Maneja todas las operaciones CRUD para las tablas de la aplicación.
     """
     
+    # PRAGMAs por conexión (journal_mode=WAL se aplica aparte, una sola vez)
+    PRAGMAS = """
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+        PRAGMA mmap_size=134217728;
+    """
+    
     def __init__(self):
         """Inicializa el gestor de base de datos."""
         self.db_path = Settings.DATABASE_PATH
         self.logger = logging.getLogger(__name__)
         
+        # Conexión persistente (se abre en el primer uso) y lock que serializa
+        # su uso entre hilos. RLock: los métodos CRUD lo toman y luego llaman
+        # a get_connection(), que también lo usa para la inicialización.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        
+        # journal_mode=WAL se guarda en el archivo: basta con activarlo una vez
+        self._wal_activado = False
+        
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Abre una conexión nueva a la base de datos.
+        
+        Returns:
+            sqlite3.Connection: Conexión recién abierta
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS
+        )
+        self._apply_pragmas(conn)
+        return conn
+    
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """
+        Aplica los PRAGMAs de rendimiento a una conexión recién abierta.
+        
+        WAL + synchronous=NORMAL evitan el doble fsync por commit y permiten
+        lecturas concurrentes con el escritor.
+        
+        Args:
+            conn (sqlite3.Connection): Conexión a configurar
+        """
+        pragmas = self.PRAGMAS
+        
+        if not self._wal_activado:
+            pragmas = "PRAGMA journal_mode=WAL;" + pragmas
+            self._wal_activado = True
+        
+        conn.executescript(pragmas)
+        
     def get_connection(self) -> sqlite3.Connection:
         """
-        Obtiene una conexión a la base de datos.
+        Obtiene la conexión persistente a la base de datos.
+        
+        Se abre una sola vez y se reutiliza. Usarla como
+        ``with self.get_connection() as conn`` hace commit/rollback al salir
+        del bloque pero no la cierra.
         
         Returns:
             sqlite3.Connection: Conexión a la base de datos
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
-        return conn
+        if self._conn is None:
+            with self._lock:
+                if self._conn is None:
+                    self._conn = self._connect()
+        return self._conn
     
+    @staticmethod
+    def _fila_afectada(cursor: sqlite3.Cursor) -> bool:
+        """
+        Indica si un UPDATE/DELETE por id modificó alguna fila.
+        
+        Con RETURNING se lee la fila devuelta (hay que hacerlo antes del
+        commit); en versiones antiguas de SQLite se recurre a rowcount.
+        
+        Args:
+            cursor (sqlite3.Cursor): Cursor de la sentencia ejecutada
+            
+        Returns:
+            bool: True si se afectó al menos una fila
+        """
+        if _SOPORTA_RETURNING:
+            return cursor.fetchone() is not None
+        return cursor.rowcount > 0
+    
+    @_sqlite_guard("Error creando tablas")
     def create_tables(self) -> None:
-        """Crea las tablas necesarias en la base de datos."""
-        try:
-            with self.get_connection() as conn:
-                # Tabla clientes
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS cliente (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        nombre TEXT NOT NULL,
-                        nit TEXT UNIQUE NOT NULL,
-                        correo TEXT,
-                        telefono TEXT
-                    )
-                """)
-                
-                # Tabla para logs de automatización (opcional)
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS automation_log (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                        action TEXT NOT NULL,
-                        status TEXT NOT NULL,
-                        details TEXT
-                    )
-                """)
-                
-                conn.commit()
-                self.logger.info("Tablas creadas correctamente")
-                
-        except sqlite3.Error as e:
-            self.logger.error(f"Error creando tablas: {e}")
-            raise
+        """
+        Crea las tablas necesarias en la base de datos.
+        
+        Solo ejecuta CREATE_ALL_SQL cuando PRAGMA user_version es menor que
+        SCHEMA_VERSION; en una base ya creada el arranque se limita a leer
+        ese PRAGMA.
+        """
+        conn = self.get_connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            self.logger.info(f"Esquema al día (versión {version})")
+            return
+        
+        conn.executescript(CREATE_ALL_SQL)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+        self.logger.info("Tablas creadas correctamente")
     
+    @_sqlite_guard("Error insertando cliente")
     def insert_client(self, cliente: Cliente) -> int:
         """
         Inserta un nuevo cliente en la base de datos.
@@ -69,21 +231,79 @@ class DatabaseManager:
         Returns:
             int: ID del cliente insertado
         """
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    INSERT INTO cliente (nombre, nit, correo, telefono)
-                    VALUES (?, ?, ?, ?)
-                """, (cliente.nombre, cliente.nit, cliente.correo, cliente.telefono))
-                
-                conn.commit()
-                self.logger.info(f"Cliente insertado: {cliente.nombre}")
-                return cursor.lastrowid
-                
-        except sqlite3.Error as e:
-            self.logger.error(f"Error insertando cliente: {e}")
-            raise
+        conn = self.get_connection()
+        cursor = conn.execute(
+            _SQL_INSERT_CLIENT,
+            (cliente.nombre, cliente.nit, cliente.correo, cliente.telefono)
+        )
+        conn.commit()
+        
+        self.logger.info(f"Cliente insertado: {cliente.nombre}")
+        return cursor.lastrowid
+    
+    @_sqlite_guard("Error insertando clientes")
+    def insert_clients(self, clientes: Iterable[Cliente]) -> int:
+        """
+        Inserta varios clientes en una sola transacción (un único commit).
+        
+        Args:
+            clientes (Iterable[Cliente]): Clientes a insertar
+            
+        Returns:
+            int: Número de clientes insertados
+        """
+        filas = (
+            (cliente.nombre, cliente.nit, cliente.correo, cliente.telefono)
+            for cliente in clientes
+        )
+        
+        conn = self.get_connection()
+        cursor = conn.executemany(_SQL_INSERT_CLIENT, filas)
+        conn.commit()
+        
+        self.logger.info(f"Clientes insertados: {cursor.rowcount}")
+        return cursor.rowcount
     
+    def iter_client_rows(self) -> Iterator[ClienteRow]:
+        """
+        Recorre los clientes ordenados por nombre, en lotes de 512 filas.
+        
+        A diferencia de get_all_clients no materializa toda la tabla: el
+        consumidor recibe el primer cliente tras leer un solo lote y puede
+        detenerse antes sin leer el resto. Cada fila es una ClienteRow
+        (tupla con acceso por atributo), sin construir un Cliente.
+        
+        Yields:
+            ClienteRow: Cada cliente de la base de datos
+        """
+        with self._lock:
+            cursor = self.get_connection().cursor()
+            cursor.row_factory = _cliente_row_factory
+            cursor.arraysize = 512
+            cursor.execute(_SQL_SELECT_CLIENTS)
+        
+        while True:
+            # El lock se toma por lote para no bloquear a otros hilos
+            # mientras el consumidor procesa los clientes ya leídos
+            with self._lock:
+                rows = cursor.fetchmany()
+            if not rows:
+                break
+            
+            yield from rows
+    
+    def iter_clients(self) -> Iterator[Cliente]:
+        """
+        Recorre los clientes ordenados por nombre como objetos Cliente.
+        
+        Yields:
+            Cliente: Cada cliente de la base de datos
+        """
+        # El orden del SELECT coincide con el de los campos de Cliente
+        for row in self.iter_client_rows():
+            yield Cliente(*row)
+    
+    @_sqlite_guard("Error obteniendo clientes", default=list)
     def get_all_clients(self) -> List[Cliente]:
         """
         Obtiene todos los clientes de la base de datos.
@@ -91,33 +311,22 @@ class DatabaseManager:
         Returns:
             List[Cliente]: Lista de todos los clientes
         """
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT id, nombre, nit, correo, telefono
-                    FROM cliente
-                    ORDER BY nombre
-                """)
-                
-                rows = cursor.fetchall()
-                clients = [
-                    Cliente(
-                        id=row['id'],
-                        nombre=row['nombre'],
-                        nit=row['nit'],
-                        correo=row['correo'],
-                        telefono=row['telefono']
-                    )
-                    for row in rows
-                ]
-                
-                self.logger.info(f"Obtenidos {len(clients)} clientes")
-                return clients
-                
-        except sqlite3.Error as e:
-            self.logger.error(f"Error obteniendo clientes: {e}")
-            return []
+        clients = list(self.iter_clients())
+        
+        self.logger.info(f"Obtenidos {len(clients)} clientes")
+        return clients
     
+    @_sqlite_guard("Error contando clientes", default=int)
+    def count_clients(self) -> int:
+        """
+        Cuenta los clientes sin leer sus filas.
+        
+        Returns:
+            int: Número de clientes en la base de datos
+        """
+        return self.get_connection().execute(_SQL_COUNT_CLIENTS).fetchone()[0]
+    
+    @_sqlite_guard("Error actualizando cliente", default=bool)
     def update_client(self, cliente: Cliente) -> bool:
         """
         Actualiza un cliente existente.
@@ -128,28 +337,23 @@ class DatabaseManager:
         Returns:
             bool: True si se actualizó correctamente
         """
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    UPDATE cliente 
-                    SET nombre=?, nit=?, correo=?, telefono=?
-                    WHERE id=?
-                """, (cliente.nombre, cliente.nit, cliente.correo, 
-                     cliente.telefono, cliente.id))
-                
-                conn.commit()
-                
-                if cursor.rowcount > 0:
-                    self.logger.info(f"Cliente actualizado: {cliente.nombre}")
-                    return True
-                else:
-                    self.logger.warning(f"No se encontró cliente con ID: {cliente.id}")
-                    return False
-                    
-        except sqlite3.Error as e:
-            self.logger.error(f"Error actualizando cliente: {e}")
+        conn = self.get_connection()
+        cursor = conn.execute(
+            _SQL_UPDATE_CLIENT,
+            (cliente.nombre, cliente.nit, cliente.correo,
+             cliente.telefono, cliente.id)
+        )
+        actualizado = self._fila_afectada(cursor)
+        conn.commit()
+        
+        if actualizado:
+            self.logger.info(f"Cliente actualizado: {cliente.nombre}")
+            return True
+        else:
+            self.logger.warning(f"No se encontró cliente con ID: {cliente.id}")
             return False
     
+    @_sqlite_guard("Error eliminando cliente", default=bool)
     def delete_client(self, client_id: int) -> bool:
         """
         Elimina un cliente por su ID.
@@ -160,18 +364,14 @@ class DatabaseManager:
         Returns:
             bool: True si se eliminó correctamente
         """
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("DELETE FROM cliente WHERE id=?", (client_id,))
-                conn.commit()
-                
-                if cursor.rowcount > 0:
-                    self.logger.info(f"Cliente eliminado con ID: {client_id}")
-                    return True
-                else:
-                    self.logger.warning(f"No se encontró cliente con ID: {client_id}")
-                    return False
-                    
-        except sqlite3.Error as e:
-            self.logger.error(f"Error eliminando cliente: {e}")
+        conn = self.get_connection()
+        cursor = conn.execute(_SQL_DELETE_CLIENT, (client_id,))
+        eliminado = self._fila_afectada(cursor)
+        conn.commit()
+        
+        if eliminado:
+            self.logger.info(f"Cliente eliminado con ID: {client_id}")
+            return True
+        else:
+            self.logger.warning(f"No se encontró cliente con ID: {client_id}")
             return False
\ No newline at end of file
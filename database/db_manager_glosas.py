@@ -1,24 +1,326 @@
 import sqlite3
 import logging
-from typing import List, Optional, Tuple, Dict
-from datetime import datetime
-from database.db_manager import DatabaseManager
+import threading
+import queue
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Set, Tuple, Dict
+from database.db_manager import DatabaseManager, _SOPORTA_RETURNING
 from database.models_glosas import CuentaGlosasPrincipal, GlosaItemDetalle, EstadoCuenta
 
+_SQL_INSERT_GLOSA_ITEM = """
+    INSERT INTO glosa_items_detalle 
+    (cuenta_principal_id, id_glosa, id_item, descripcion_item,
+     tipo, descripcion, justificacion, valor_glosado, estado_original,
+     es_procesable)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Índices de glosa_items_detalle. Se separan del resto del esquema para
+# poder eliminarlos durante una carga masiva y reconstruirlos al final.
+_SQL_CREATE_GLOSA_INDEXES = """
+    CREATE INDEX IF NOT EXISTS idx_glosa_cuenta_id 
+    ON glosa_items_detalle(cuenta_principal_id);
+    
+    CREATE INDEX IF NOT EXISTS idx_glosa_id_glosa 
+    ON glosa_items_detalle(id_glosa);
+"""
+
+_SQL_DROP_GLOSA_INDEXES = """
+    DROP INDEX IF EXISTS idx_glosa_cuenta_id;
+    DROP INDEX IF EXISTS idx_glosa_id_glosa;
+"""
+
+# Columnas en el orden de los campos que espera CuentaGlosasPrincipal.from_row
+_SQL_CUENTAS_PENDIENTES = """
+    SELECT id, idcuenta, numero_radicacion, fecha_radicacion, proveedor,
+           numero_factura, fecha_factura, valor_factura, valor_glosado,
+           estado, fecha_inicio, fecha_fin, glosas_encontradas,
+           glosas_tarifas, glosas_procesadas, motivo_fallo, intentos
+    FROM cuenta_glosas_principal 
+    WHERE estado IN ('PENDIENTE', 'FALLIDO')
+    ORDER BY created_at ASC
+    LIMIT ?
+"""
+
+# Columnas que muestra la tabla de cuentas, en el orden de cada tupla de
+# fetch_cuentas_rows
+_SQL_CUENTAS_TABLA = """
+    SELECT idcuenta, proveedor, estado, glosas_encontradas,
+           glosas_procesadas, fecha_inicio, motivo_fallo
+    FROM cuenta_glosas_principal 
+    ORDER BY fecha_inicio DESC
+"""
+
+_SQL_CUENTA_ESTADO = """
+    SELECT estado FROM cuenta_glosas_principal 
+    WHERE idcuenta = ?
+"""
+
+_SQL_CUENTA_ID_ESTADO = """
+    SELECT id, estado FROM cuenta_glosas_principal WHERE idcuenta = ?
+"""
+
+_SQL_CUENTA_ID = """
+    SELECT id FROM cuenta_glosas_principal WHERE idcuenta = ?
+"""
+
+# La condición sobre el estado va en el WHERE: no hace falta leer la fila
+# antes para decidir si se actualiza
+_SQL_UPDATE_CUENTA_DATOS = """
+    UPDATE cuenta_glosas_principal 
+    SET numero_radicacion = ?, fecha_radicacion = ?, proveedor = ?,
+        numero_factura = ?, fecha_factura = ?, valor_factura = ?,
+        valor_glosado = ?, estado = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE idcuenta = ? AND estado != 'COMPLETADO'
+"""
+
+# Solo para cuentas nuevas: create_or_update_cuenta consulta antes el id.
+# Un INSERT que choca con idcuenta (OR IGNORE / ON CONFLICT) consume igual un
+# valor de AUTOINCREMENT y cada reimportación dejaría huecos en los id
+_SQL_INSERT_CUENTA = """
+    INSERT INTO cuenta_glosas_principal 
+    (idcuenta, numero_radicacion, fecha_radicacion, proveedor,
+     numero_factura, fecha_factura, valor_factura, valor_glosado,
+     estado, intentos)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+"""
+
+# Decisión de should_process_cuenta por estado actual (None = no existe):
+# (debe procesarse, motivo para el log)
+_DECISION_POR_ESTADO = {
+    None: (True, "Primera vez, se importará como PENDIENTE"),
+    EstadoCuenta.PENDIENTE: (True, "Estado PENDIENTE, se procesará"),
+    EstadoCuenta.FALLIDO: (True, "Estado FALLIDO, se reintentará"),
+    EstadoCuenta.EN_PROCESO: (False, "Estado EN_PROCESO, se saltará para evitar duplicados"),
+    EstadoCuenta.COMPLETADO: (False, "Estado COMPLETADO, se saltará"),
+}
+
+# Alta o actualización en una sola sentencia. Las cuentas EN_PROCESO o
+# COMPLETADO no se tocan (el WHERE del DO UPDATE las excluye) y en ese caso
+# RETURNING no devuelve fila: el estado se consulta aparte.
+_SQL_UPSERT_CUENTA_BULK = """
+    INSERT INTO cuenta_glosas_principal 
+    (idcuenta, numero_radicacion, fecha_radicacion, proveedor,
+     numero_factura, fecha_factura, valor_factura, valor_glosado,
+     estado, intentos)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'PENDIENTE', 0)
+    ON CONFLICT(idcuenta) DO UPDATE SET
+        numero_radicacion = excluded.numero_radicacion,
+        fecha_radicacion = excluded.fecha_radicacion,
+        proveedor = excluded.proveedor,
+        numero_factura = excluded.numero_factura,
+        fecha_factura = excluded.fecha_factura,
+        valor_factura = excluded.valor_factura,
+        valor_glosado = excluded.valor_glosado,
+        estado = 'PENDIENTE',
+        updated_at = CURRENT_TIMESTAMP
+    WHERE estado NOT IN ('EN_PROCESO', 'COMPLETADO')
+"""
+
+_SQL_UPSERT_CUENTA = _SQL_UPSERT_CUENTA_BULK + "    RETURNING id, estado\n"
+
+# Máximo de parámetros por consulta IN (...): por debajo del límite de
+# 999 variables de las versiones antiguas de SQLite
+_MAX_IN_PARAMS = 900
+
+# UPDATE de estado con texto fijo para cada combinación de
+# (con fecha_fin, con estadísticas de glosas): al no armarse con f-strings
+# en cada llamada, la caché de sentencias de la conexión los reutiliza.
+_SQL_UPDATE_ESTADO = {
+    (False, False): """
+        UPDATE cuenta_glosas_principal 
+        SET estado = ?, motivo_fallo = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE idcuenta = ?
+    """,
+    (True, False): """
+        UPDATE cuenta_glosas_principal 
+        SET estado = ?, motivo_fallo = ?, fecha_fin = CURRENT_TIMESTAMP,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE idcuenta = ?
+    """,
+    (False, True): """
+        UPDATE cuenta_glosas_principal 
+        SET estado = ?, motivo_fallo = ?,
+            glosas_encontradas = ?, glosas_tarifas = ?, glosas_procesadas = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE idcuenta = ?
+    """,
+    (True, True): """
+        UPDATE cuenta_glosas_principal 
+        SET estado = ?, motivo_fallo = ?, fecha_fin = CURRENT_TIMESTAMP,
+            glosas_encontradas = ?, glosas_tarifas = ?, glosas_procesadas = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE idcuenta = ?
+    """,
+}
+
+def _cuenta_upsert_params(cuenta_data: dict) -> tuple:
+    """Parámetros de _SQL_UPSERT_CUENTA para una cuenta extraída de la tabla web."""
+    return (
+        cuenta_data['idcuenta'],
+        cuenta_data.get('numero_radicacion', ''),
+        cuenta_data.get('fecha_radicacion', ''),
+        cuenta_data.get('proveedor', ''),
+        cuenta_data.get('numero_factura', ''),
+        cuenta_data.get('fecha_factura', ''),
+        cuenta_data.get('valor_factura', 0.0),
+        cuenta_data.get('valor_glosado', 0.0),
+    )
+
+def _glosa_item_params(cuenta_id: int, glosa_data: dict) -> tuple:
+    """Parámetros de _SQL_INSERT_GLOSA_ITEM para una glosa extraída de la tabla web."""
+    return (
+        cuenta_id,
+        glosa_data['id_glosa'],
+        glosa_data.get('id_item', ''),
+        glosa_data.get('descripcion_item', ''),
+        glosa_data.get('tipo', ''),
+        glosa_data.get('descripcion', ''),
+        glosa_data.get('justificacion', ''),
+        glosa_data.get('valor_glosado', 0.0),
+        glosa_data.get('estado_original', ''),
+        glosa_data.get('es_procesable', False)
+    )
+
 class DatabaseManagerGlosas(DatabaseManager):
     """
     Extensión del DatabaseManager para manejar glosas.
     Hereda toda la funcionalidad base y agrega métodos específicos para glosas.
     """
     
+    # Las tablas de glosas son las más grandes y las que más se escriben:
+    # caché de 64 MB y mmap de 256 MB. Las claves foráneas siguen sin
+    # verificarse (valor por defecto de SQLite): nada borra cuentas ni
+    # depende de cascadas
+    PRAGMAS = """
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+        PRAGMA mmap_size=268435456;
+    """
+    
+    # Conexiones de solo lectura en el pool de lectores
+    READER_POOL_SIZE = 4
+    
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(__name__)
+        # Una conexión reutilizable por hilo (UI, worker, hilos de asyncio.to_thread)
+        self._local = threading.local()
+        
+        # Pools para los métodos propios: un único escritor (SQLite serializa
+        # las escrituras de todos modos) y varios lectores que, con WAL, leen
+        # en paralelo con él. Se rellenan con None y cada conexión se abre
+        # la primera vez que se saca del pool.
+        self._writer_pool: "queue.Queue[Optional[sqlite3.Connection]]" = queue.Queue()
+        self._writer_pool.put(None)
+        self._reader_pool: "queue.Queue[Optional[sqlite3.Connection]]" = queue.Queue()
+        for _ in range(self.READER_POOL_SIZE):
+            self._reader_pool.put(None)
+        
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Abre una conexión nueva con acceso a columnas por nombre.
+        
+        El código de glosas (y quien usa get_connection()) lee las filas
+        como ``row['estado']``; el gestor base devuelve tuplas simples.
+        
+        Returns:
+            sqlite3.Connection: Conexión recién abierta
+        """
+        conn = super()._connect()
+        conn.row_factory = sqlite3.Row
+        return conn
+        
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Obtiene la conexión del hilo actual, abriéndola solo la primera vez.
+        
+        La conexión se reutiliza entre llamadas: usarla como
+        ``with self.get_connection() as conn`` sigue haciendo commit/rollback
+        al salir del bloque, pero no la cierra. Es la que usan los widgets y
+        procesadores externos; los métodos de esta clase usan los pools
+        _reader()/_writer().
+        
+        Returns:
+            sqlite3.Connection: Conexión del hilo actual
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+        
+    @contextmanager
+    def _pooled(self, pool: queue.Queue, solo_lectura: bool) -> Iterator[sqlite3.Connection]:
+        """
+        Presta una conexión del pool durante el bloque ``with``.
+        
+        La conexión se usa a su vez como context manager (commit/rollback al
+        salir) y se devuelve al pool abierta, aunque el bloque falle.
+        
+        Args:
+            pool (queue.Queue): Pool del que tomar la conexión
+            solo_lectura (bool): Si la conexión nueva debe abrirse con query_only
+        """
+        conn = pool.get()
+        try:
+            if conn is None:
+                conn = self._connect()
+                if solo_lectura:
+                    conn.execute("PRAGMA query_only=ON")
+            with conn:
+                yield conn
+        finally:
+            pool.put(conn)
+    
+    def close(self) -> None:
+        """
+        Cierra las conexiones de los pools, refrescando antes las estadísticas.
         
+        PRAGMA optimize solo vuelve a analizar las tablas cuyas consultas lo
+        necesitaron durante la vida de la conexión, así que es barato. Se corre
+        en el escritor: los lectores son query_only y no pueden guardar las
+        estadísticas. Las conexiones prestadas en ese momento no se tocan.
+        """
+        for pool in (self._writer_pool, self._reader_pool):
+            libres = []
+            while True:
+                try:
+                    libres.append(pool.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for conn in libres:
+                if conn is not None:
+                    if pool is self._writer_pool:
+                        try:
+                            conn.execute("PRAGMA optimize")
+                        except sqlite3.Error as e:
+                            self.logger.warning("PRAGMA optimize falló: %s", e)
+                    conn.close()
+                # Hueco vacío: el pool sigue usable y reabre bajo demanda
+                pool.put(None)
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            # Objeto a medio construir o intérprete cerrándose
+            pass
+    
+    def _writer(self):
+        """Conexión del escritor único para INSERT/UPDATE/DDL."""
+        return self._pooled(self._writer_pool, solo_lectura=False)
+    
+    def _reader(self):
+        """Conexión de solo lectura del pool de lectores."""
+        return self._pooled(self._reader_pool, solo_lectura=True)
+    
     def create_glosas_tables(self) -> None:
         """Crea las tablas necesarias para el manejo de glosas."""
         try:
-            with self.get_connection() as conn:
+            with self._writer() as conn:
                 # Tabla principal de cuentas de glosas
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS cuenta_glosas_principal (
@@ -39,7 +341,7 @@ class DatabaseManagerGlosas(DatabaseManager):
                         glosas_tarifas INTEGER DEFAULT 0,
                         glosas_procesadas INTEGER DEFAULT 0,
                         motivo_fallo TEXT,
-                        intentos INTEGER DEFAULT 0,
+                        intentos INTEGER DEFAULT 0 CHECK (intentos >= 0 AND intentos <= 100),
                         
                         created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                         updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
@@ -80,23 +382,84 @@ class DatabaseManagerGlosas(DatabaseManager):
                     ON cuenta_glosas_principal(idcuenta)
                 """)
                 
+                # Índice parcial con solo las filas sin procesar: el IN de
+                # _SQL_CUENTAS_PENDIENTES coincide literalmente con el WHERE,
+                # así que la cola se lee ya ordenada por created_at sin
+                # recorrer el histórico de cuentas completadas
                 conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_glosa_cuenta_id 
-                    ON glosa_items_detalle(cuenta_principal_id)
+                    CREATE INDEX IF NOT EXISTS idx_cuenta_pendiente
+                    ON cuenta_glosas_principal(created_at)
+                    WHERE estado IN ('PENDIENTE', 'FALLIDO')
                 """)
                 
-                conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_glosa_id_glosa 
-                    ON glosa_items_detalle(id_glosa)
-                """)
+                # Los índices EN PAUSA usan 'intentos': en una BD anterior a
+                # las migraciones la columna aún no existe y los crean ellas
+                tiene_intentos = conn.execute("""
+                    SELECT 1 FROM pragma_table_info('cuenta_glosas_principal')
+                    WHERE name = 'intentos'
+                """).fetchone()
+                
+                if tiene_intentos:
+                    # Índice parcial de la tabla EN PAUSA: mismo IN que su
+                    # load_data, que lee las filas ya ordenadas por intentos y
+                    # fecha sin recorrer las cuentas completadas
+                    conn.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_cuenta_en_pausa
+                        ON cuenta_glosas_principal(intentos DESC, fecha_inicio DESC)
+                        WHERE estado IN ('FALLIDO', 'EN_PROCESO', 'FALLA_TOTAL')
+                    """)
+                    
+                    # Índice para los contadores EN PAUSA (GROUP BY estado,
+                    # intentos): los grupos salen del índice sin leer la tabla.
+                    # Es el mismo que crean las migraciones EN PAUSA e
+                    # intentos, único índice que empieza por (estado, intentos)
+                    conn.execute("DROP INDEX IF EXISTS idx_estado_intentos")
+                    conn.execute("""
+                        CREATE INDEX IF NOT EXISTS idx_estado_intentos_fecha
+                        ON cuenta_glosas_principal(estado, intentos, fecha_inicio)
+                    """)
+                
+                conn.executescript(_SQL_CREATE_GLOSA_INDEXES)
                 
-                conn.commit()
                 self.logger.info("Tablas de glosas creadas correctamente")
                 
         except sqlite3.Error as e:
-            self.logger.error(f"Error creando tablas de glosas: {e}")
+            self.logger.error("Error creando tablas de glosas: %s", e)
             raise
     
+    def drop_glosa_indexes(self) -> None:
+        """Elimina los índices de glosa_items_detalle antes de una carga masiva."""
+        with self._writer() as conn:
+            conn.executescript(_SQL_DROP_GLOSA_INDEXES)
+        self.logger.info("Índices de glosas eliminados para carga masiva")
+    
+    def create_glosa_indexes(self) -> None:
+        """(Re)crea los índices de glosa_items_detalle en una sola pasada."""
+        with self._writer() as conn:
+            conn.executescript(_SQL_CREATE_GLOSA_INDEXES)
+        self.logger.info("Índices de glosas creados")
+    
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """
+        Contexto para cargas masivas en glosa_items_detalle.
+        
+        Quita los índices al entrar y los reconstruye al salir (también si
+        la carga falla): un solo recorrido para construir cada índice en vez
+        de mantenerlo fila a fila durante los INSERT.
+        
+        Ejemplo::
+        
+            with db_manager.bulk_load():
+                for cuenta_id, glosas in glosas_por_cuenta.items():
+                    db_manager.save_glosa_items_bulk(cuenta_id, glosas)
+        """
+        self.drop_glosa_indexes()
+        try:
+            yield
+        finally:
+            self.create_glosa_indexes()
+    
     def get_cuenta_estado(self, idcuenta: str) -> Optional[EstadoCuenta]:
         """
         Obtiene el estado actual de una cuenta.
@@ -108,11 +471,8 @@ class DatabaseManagerGlosas(DatabaseManager):
             Optional[EstadoCuenta]: Estado de la cuenta o None si no existe
         """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT estado FROM cuenta_glosas_principal 
-                    WHERE idcuenta = ?
-                """, (idcuenta,))
+            with self._reader() as conn:
+                cursor = conn.execute(_SQL_CUENTA_ESTADO, (idcuenta,))
                 
                 row = cursor.fetchone()
                 if row:
@@ -120,7 +480,7 @@ class DatabaseManagerGlosas(DatabaseManager):
                 return None
                 
         except sqlite3.Error as e:
-            self.logger.error(f"Error obteniendo estado de cuenta {idcuenta}: {e}")
+            self.logger.error("Error obteniendo estado de cuenta %s: %s", idcuenta, e)
             return None
     
     def should_process_cuenta(self, idcuenta: str) -> bool:
@@ -135,35 +495,52 @@ class DatabaseManagerGlosas(DatabaseManager):
             bool: True si debe procesarse, False si debe saltarse
         """
         estado = self.get_cuenta_estado(idcuenta)
+        procesar, motivo = _DECISION_POR_ESTADO.get(
+            estado, (True, "Estado desconocido ({}), se procesará por defecto")
+        )
         
-        if estado is None:
-            # Primera vez, debe importarse (se creará como PENDIENTE)
-            self.logger.info(f"Cuenta {idcuenta}: Primera vez, se importará como PENDIENTE")
-            return True
-        
-        if estado == EstadoCuenta.PENDIENTE:
-            # Está pendiente, debe procesarse
-            self.logger.info(f"Cuenta {idcuenta}: Estado PENDIENTE, se procesará")
-            return True
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Cuenta %s: %s", idcuenta, motivo.format(estado))
+        return procesar
+    
+    def filter_processable(self, idcuentas: List[str]) -> Set[str]:
+        """
+        Versión por lotes de should_process_cuenta.
         
-        if estado == EstadoCuenta.FALLIDO:
-            # Falló anteriormente, dar otra oportunidad
-            self.logger.info(f"Cuenta {idcuenta}: Estado FALLIDO, se reintentará")
-            return True
+        Consulta los estados con ``IN (...)`` por bloques en lugar de una
+        consulta por cuenta y aplica la misma tabla de decisión, sin log
+        por cuenta.
         
-        if estado == EstadoCuenta.EN_PROCESO:
-            # Ya está en proceso, no tocar (evitar duplicados)
-            self.logger.info(f"Cuenta {idcuenta}: Estado EN_PROCESO, se saltará para evitar duplicados")
-            return False
+        Args:
+            idcuentas (List[str]): IDs de las cuentas a evaluar
+            
+        Returns:
+            Set[str]: IDs de las cuentas que deben procesarse
+        """
+        ids = list(dict.fromkeys(idcuentas))
+        estados = {}
         
-        if estado == EstadoCuenta.COMPLETADO:
-            # Ya está completada, saltar
-            self.logger.info(f"Cuenta {idcuenta}: Estado COMPLETADO, se saltará")
-            return False
+        try:
+            with self._reader() as conn:
+                for inicio in range(0, len(ids), _MAX_IN_PARAMS):
+                    bloque = ids[inicio:inicio + _MAX_IN_PARAMS]
+                    cursor = conn.execute(f"""
+                        SELECT idcuenta, estado FROM cuenta_glosas_principal
+                        WHERE idcuenta IN ({",".join("?" * len(bloque))})
+                    """, bloque)
+                    for row in cursor:
+                        estados[row['idcuenta']] = EstadoCuenta(row['estado'])
+                        
+        except sqlite3.Error as e:
+            self.logger.error("Error obteniendo estados de cuentas: %s", e)
+            return set()
         
-        # Caso por defecto, procesar
-        self.logger.info(f"Cuenta {idcuenta}: Estado desconocido ({estado}), se procesará por defecto")
-        return True
+        procesables = {
+            idcuenta for idcuenta in ids
+            if _DECISION_POR_ESTADO.get(estados.get(idcuenta), (True,))[0]
+        }
+        self.logger.info("%s/%s cuentas procesables", len(procesables), len(ids))
+        return procesables
     
     # EN LA CLASE DatabaseManagerGlosas (database/db_manager_glosas.py)
     # REEMPLAZAR EL MÉTODO create_or_update_cuenta POR ESTE:
@@ -180,51 +557,12 @@ class DatabaseManagerGlosas(DatabaseManager):
             int: ID de la cuenta en la base de datos
         """
         try:
-            with self.get_connection() as conn:
-                # Verificar si existe
-                cursor = conn.execute("""
-                    SELECT id, estado FROM cuenta_glosas_principal WHERE idcuenta = ?
-                """, (cuenta_data['idcuenta'],))
-                
-                existing_row = cursor.fetchone()
+            with self._writer() as conn:
+                row = conn.execute(_SQL_CUENTA_ID, (cuenta_data['idcuenta'],)).fetchone()
                 
-                if existing_row:
-                    # Actualizar existente SOLO si NO está completada
-                    cuenta_id = existing_row['id']
-                    estado_actual = existing_row['estado']
-                    
-                    if estado_actual != 'COMPLETADO':
-                        conn.execute("""
-                            UPDATE cuenta_glosas_principal 
-                            SET numero_radicacion = ?, fecha_radicacion = ?, proveedor = ?,
-                                numero_factura = ?, fecha_factura = ?, valor_factura = ?,
-                                valor_glosado = ?, estado = ?, updated_at = CURRENT_TIMESTAMP
-                            WHERE id = ?
-                        """, (
-                            cuenta_data.get('numero_radicacion', ''),
-                            cuenta_data.get('fecha_radicacion', ''),
-                            cuenta_data.get('proveedor', ''),
-                            cuenta_data.get('numero_factura', ''),
-                            cuenta_data.get('fecha_factura', ''),
-                            cuenta_data.get('valor_factura', 0.0),
-                            cuenta_data.get('valor_glosado', 0.0),
-                            EstadoCuenta.PENDIENTE.value,  # ✅ CAMBIO: PENDIENTE en lugar de EN_PROCESO
-                            cuenta_id
-                        ))
-                        
-                        self.logger.info(f"Cuenta {cuenta_data['idcuenta']} actualizada como PENDIENTE")
-                    else:
-                        self.logger.info(f"Cuenta {cuenta_data['idcuenta']} ya está COMPLETADA, no se actualiza")
-                    
-                else:
+                if row is None:
                     # Crear nueva como PENDIENTE
-                    cursor = conn.execute("""
-                        INSERT INTO cuenta_glosas_principal 
-                        (idcuenta, numero_radicacion, fecha_radicacion, proveedor,
-                         numero_factura, fecha_factura, valor_factura, valor_glosado,
-                         estado, intentos)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-                    """, (
+                    cursor = conn.execute(_SQL_INSERT_CUENTA, (
                         cuenta_data['idcuenta'],
                         cuenta_data.get('numero_radicacion', ''),
                         cuenta_data.get('fecha_radicacion', ''),
@@ -237,13 +575,112 @@ class DatabaseManagerGlosas(DatabaseManager):
                     ))
                     
                     cuenta_id = cursor.lastrowid
-                    self.logger.info(f"Cuenta {cuenta_data['idcuenta']} creada como PENDIENTE con ID {cuenta_id}")
+                    self.logger.info("Cuenta %s creada como PENDIENTE con ID %s", cuenta_data['idcuenta'], cuenta_id)
+                    return cuenta_id
+                
+                # Existente: actualizar SOLO si NO está completada
+                cursor = conn.execute(_SQL_UPDATE_CUENTA_DATOS, (
+                    cuenta_data.get('numero_radicacion', ''),
+                    cuenta_data.get('fecha_radicacion', ''),
+                    cuenta_data.get('proveedor', ''),
+                    cuenta_data.get('numero_factura', ''),
+                    cuenta_data.get('fecha_factura', ''),
+                    cuenta_data.get('valor_factura', 0.0),
+                    cuenta_data.get('valor_glosado', 0.0),
+                    EstadoCuenta.PENDIENTE.value,  # ✅ CAMBIO: PENDIENTE en lugar de EN_PROCESO
+                    cuenta_data['idcuenta']
+                ))
+                
+                if cursor.rowcount:
+                    self.logger.info("Cuenta %s actualizada como PENDIENTE", cuenta_data['idcuenta'])
+                else:
+                    self.logger.info("Cuenta %s ya está COMPLETADA, no se actualiza", cuenta_data['idcuenta'])
+                
+                return row['id']
+                
+        except sqlite3.Error as e:
+            self.logger.error("Error creando/actualizando cuenta: %s", e)
+            raise
+        
+    def upsert_cuenta(self, cuenta_data: dict) -> Tuple[int, EstadoCuenta]:
+        """
+        Crea o actualiza una cuenta como PENDIENTE en una sola sentencia.
+        
+        Sustituye la pareja should_process_cuenta + create_or_update_cuenta:
+        las cuentas nuevas, PENDIENTE o FALLIDO quedan PENDIENTE con los datos
+        de la tabla web; las EN_PROCESO o COMPLETADO se dejan intactas. El
+        llamador debe procesar la cuenta si el estado devuelto es PENDIENTE.
+        
+        Args:
+            cuenta_data (dict): Datos de la cuenta extraídos de la tabla web
+            
+        Returns:
+            Tuple[int, EstadoCuenta]: ID de la cuenta y su estado tras la operación
+        """
+        if not _SOPORTA_RETURNING:
+            # SQLite < 3.35: mismo resultado con las consultas por separado
+            if self.should_process_cuenta(cuenta_data['idcuenta']):
+                return self.create_or_update_cuenta(cuenta_data), EstadoCuenta.PENDIENTE
+            with self._reader() as conn:
+                row = conn.execute(_SQL_CUENTA_ID_ESTADO, (cuenta_data['idcuenta'],)).fetchone()
+            return row['id'], EstadoCuenta(row['estado'])
+        
+        try:
+            with self._writer() as conn:
+                row = conn.execute(
+                    _SQL_UPSERT_CUENTA, _cuenta_upsert_params(cuenta_data)
+                ).fetchone()
                 
-                conn.commit()
-                return cuenta_id
+                if row is None:
+                    # La cuenta existía EN_PROCESO o COMPLETADO y no se modificó
+                    row = conn.execute(_SQL_CUENTA_ID_ESTADO, (cuenta_data['idcuenta'],)).fetchone()
+            
+            return row['id'], EstadoCuenta(row['estado'])
+            
+        except sqlite3.Error as e:
+            self.logger.error("Error guardando cuenta %s: %s", cuenta_data['idcuenta'], e)
+            raise
+        
+    def upsert_cuentas_bulk(self, cuentas_data: List[dict]) -> Dict[str, Tuple[int, EstadoCuenta]]:
+        """
+        Versión por lotes de upsert_cuenta para importar una tabla completa.
+        
+        Todas las cuentas se guardan en una sola transacción con executemany
+        y los IDs/estados resultantes se leen después con consultas
+        ``IN (...)`` por bloques, en lugar de una consulta por cuenta.
+        
+        Args:
+            cuentas_data (List[dict]): Datos de las cuentas extraídos de la tabla web
+            
+        Returns:
+            Dict[str, Tuple[int, EstadoCuenta]]: (ID, estado) por idcuenta
+        """
+        rows = [_cuenta_upsert_params(cuenta_data) for cuenta_data in cuentas_data]
+        if not rows:
+            return {}
+        
+        idcuentas = list(dict.fromkeys(row[0] for row in rows))
+        resultado = {}
+        
+        try:
+            with self._writer() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(_SQL_UPSERT_CUENTA_BULK, rows)
                 
+                for inicio in range(0, len(idcuentas), _MAX_IN_PARAMS):
+                    bloque = idcuentas[inicio:inicio + _MAX_IN_PARAMS]
+                    cursor = conn.execute(f"""
+                        SELECT idcuenta, id, estado FROM cuenta_glosas_principal
+                        WHERE idcuenta IN ({",".join("?" * len(bloque))})
+                    """, bloque)
+                    for row in cursor:
+                        resultado[row['idcuenta']] = (row['id'], EstadoCuenta(row['estado']))
+            
+            self.logger.info("%s cuentas guardadas en bloque", len(idcuentas))
+            return resultado
+            
         except sqlite3.Error as e:
-            self.logger.error(f"Error creando/actualizando cuenta: {e}")
+            self.logger.error("Error guardando cuentas en bloque: %s", e)
             raise
         
     def save_glosa_item(self, cuenta_id: int, glosa_data: dict) -> int:
@@ -258,34 +695,50 @@ class DatabaseManagerGlosas(DatabaseManager):
             int: ID del item de glosa guardado
         """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    INSERT INTO glosa_items_detalle 
-                    (cuenta_principal_id, id_glosa, id_item, descripcion_item,
-                     tipo, descripcion, justificacion, valor_glosado, estado_original,
-                     es_procesable)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    cuenta_id,
-                    glosa_data['id_glosa'],
-                    glosa_data.get('id_item', ''),
-                    glosa_data.get('descripcion_item', ''),
-                    glosa_data.get('tipo', ''),
-                    glosa_data.get('descripcion', ''),
-                    glosa_data.get('justificacion', ''),
-                    glosa_data.get('valor_glosado', 0.0),
-                    glosa_data.get('estado_original', ''),
-                    glosa_data.get('es_procesable', False)
-                ))
+            with self._writer() as conn:
+                cursor = conn.execute(
+                    _SQL_INSERT_GLOSA_ITEM,
+                    _glosa_item_params(cuenta_id, glosa_data)
+                )
                 
                 glosa_item_id = cursor.lastrowid
-                conn.commit()
                 
-                self.logger.info(f"Glosa {glosa_data['id_glosa']} guardada con ID {glosa_item_id}")
+                self.logger.info("Glosa %s guardada con ID %s", glosa_data['id_glosa'], glosa_item_id)
                 return glosa_item_id
                 
         except sqlite3.Error as e:
-            self.logger.error(f"Error guardando glosa item: {e}")
+            self.logger.error("Error guardando glosa item: %s", e)
+            raise
+    
+    def save_glosa_items_bulk(self, cuenta_id: int, glosas_data: List[dict]) -> int:
+        """
+        Guarda varias glosas de una cuenta en una sola transacción.
+        
+        Preferible a llamar save_glosa_item en un bucle: un único commit
+        (un fsync) y una sola sentencia preparada para todas las filas.
+        
+        Args:
+            cuenta_id (int): ID de la cuenta principal
+            glosas_data (List[dict]): Datos de las glosas extraídos de la tabla web
+            
+        Returns:
+            int: Número de glosas guardadas
+        """
+        rows = [_glosa_item_params(cuenta_id, glosa_data) for glosa_data in glosas_data]
+        if not rows:
+            return 0
+        
+        try:
+            with self._writer() as conn:
+                # Tomar el bloqueo de escritura desde el inicio de la transacción
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(_SQL_INSERT_GLOSA_ITEM, rows)
+            
+            self.logger.info("%s glosas guardadas para cuenta ID %s", len(rows), cuenta_id)
+            return len(rows)
+            
+        except sqlite3.Error as e:
+            self.logger.error("Error guardando glosas de cuenta ID %s: %s", cuenta_id, e)
             raise
     
     def update_cuenta_estado(self, idcuenta: str, estado: EstadoCuenta, 
@@ -304,16 +757,12 @@ class DatabaseManagerGlosas(DatabaseManager):
             bool: True si se actualizó correctamente
         """
         try:
-            with self.get_connection() as conn:
+            with self._writer() as conn:
                 update_data = [estado.value, motivo_fallo]
-                update_fields = "estado = ?, motivo_fallo = ?"
-                
-                if estado == EstadoCuenta.COMPLETADO:
-                    update_fields += ", fecha_fin = ?"
-                    update_data.append(datetime.now())
+                con_fecha_fin = estado == EstadoCuenta.COMPLETADO
+                con_stats = bool(glosas_stats)
                 
-                if glosas_stats:
-                    update_fields += ", glosas_encontradas = ?, glosas_tarifas = ?, glosas_procesadas = ?"
+                if con_stats:
                     update_data.extend([
                         glosas_stats.get('encontradas', 0),
                         glosas_stats.get('tarifas', 0),
@@ -322,23 +771,19 @@ class DatabaseManagerGlosas(DatabaseManager):
                 
                 update_data.append(idcuenta)  # WHERE clause
                 
-                cursor = conn.execute(f"""
-                    UPDATE cuenta_glosas_principal 
-                    SET {update_fields}, updated_at = CURRENT_TIMESTAMP
-                    WHERE idcuenta = ?
-                """, update_data)
-                
-                conn.commit()
+                cursor = conn.execute(
+                    _SQL_UPDATE_ESTADO[con_fecha_fin, con_stats], update_data
+                )
                 
                 if cursor.rowcount > 0:
-                    self.logger.info(f"Estado de cuenta {idcuenta} actualizado a {estado.value}")
+                    self.logger.info("Estado de cuenta %s actualizado a %s", idcuenta, estado.value)
                     return True
                 else:
-                    self.logger.warning(f"No se encontró cuenta {idcuenta} para actualizar")
+                    self.logger.warning("No se encontró cuenta %s para actualizar", idcuenta)
                     return False
                     
         except sqlite3.Error as e:
-            self.logger.error(f"Error actualizando estado de cuenta: {e}")
+            self.logger.error("Error actualizando estado de cuenta: %s", e)
             return False
     
     def get_cuentas_pendientes(self, limit: int = 100) -> List[CuentaGlosasPrincipal]:
@@ -352,32 +797,83 @@ class DatabaseManagerGlosas(DatabaseManager):
             List[CuentaGlosasPrincipal]: Lista de cuentas pendientes
         """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT * FROM cuenta_glosas_principal 
-                    WHERE estado IN ('PENDIENTE', 'FALLIDO')
-                    ORDER BY created_at ASC
-                    LIMIT ?
-                """, (limit,))
+            with self._reader() as conn:
+                # Tuplas planas: from_row lee por posición, sqlite3.Row sobra
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(_SQL_CUENTAS_PENDIENTES, (limit,))
                 
-                rows = cursor.fetchall()
-                cuentas = [CuentaGlosasPrincipal.from_dict(dict(row)) for row in rows]
+                cuentas = [CuentaGlosasPrincipal.from_row(row) for row in cursor]
                 
-                self.logger.info(f"Obtenidas {len(cuentas)} cuentas pendientes")
+                self.logger.info("Obtenidas %s cuentas pendientes", len(cuentas))
                 return cuentas
                 
         except sqlite3.Error as e:
-            self.logger.error(f"Error obteniendo cuentas pendientes: {e}")
+            self.logger.error("Error obteniendo cuentas pendientes: %s", e)
+            return []
+    
+    def iter_cuentas_pendientes(self, batch: int = 500) -> Iterator[CuentaGlosasPrincipal]:
+        """
+        Recorre todas las cuentas pendientes leyendo de a ``batch`` filas.
+        
+        A diferencia de get_cuentas_pendientes no tiene límite ni materializa
+        la cola completa: la memoria queda acotada al tamaño del lote. Mientras
+        el generador está abierto ocupa una conexión del pool de lectores;
+        con WAL los escritores no se bloquean por esta lectura larga.
+        
+        Args:
+            batch (int): Filas a leer por cada fetchmany
+            
+        Yields:
+            CuentaGlosasPrincipal: Cada cuenta pendiente, de la más antigua
+            a la más reciente
+        """
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                # LIMIT -1: sin límite
+                cursor.execute(_SQL_CUENTAS_PENDIENTES, (-1,))
+                
+                while True:
+                    rows = cursor.fetchmany(batch)
+                    if not rows:
+                        break
+                    
+                    for row in rows:
+                        yield CuentaGlosasPrincipal.from_row(row)
+                        
+        except sqlite3.Error as e:
+            self.logger.error("Error recorriendo cuentas pendientes: %s", e)
+    
+    def fetch_cuentas_rows(self) -> List[tuple]:
+        """
+        Obtiene las cuentas para mostrarlas en una tabla.
+        
+        Solo lectura para la interfaz: devuelve tuplas planas, sin construir
+        CuentaGlosasPrincipal ni sqlite3.Row por fila.
+        
+        Returns:
+            List[tuple]: (idcuenta, proveedor, estado, glosas_encontradas,
+            glosas_procesadas, fecha_inicio, motivo_fallo) por cuenta, de la
+            más reciente a la más antigua
+        """
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                return cursor.execute(_SQL_CUENTAS_TABLA).fetchall()
+                
+        except sqlite3.Error as e:
+            self.logger.error("Error obteniendo cuentas para tabla: %s", e)
             return []
     
     def crear_cuenta_glosa_pausa(self, idcuenta, proveedor, valor_glosado, fecha_radicacion, **kwargs):
-        print(f"⚠️ [DEBUG] crear_cuenta_glosa_pausa llamado para idcuenta={idcuenta}")  # <-- Depuración
-        self.logger.info(f"⚠️ [DEBUG] creando cuenta EN PAUSA {idcuenta} como FALLIDO")
-       
         """
         Crea una cuenta glosa para EN PAUSA con estado FALLIDO por defecto.
         """
-        with self.get_connection() as conn:
+        self.logger.debug("Creando cuenta EN PAUSA %s como FALLIDO", idcuenta)
+        with self._writer() as conn:
             conn.execute("""
                 INSERT INTO cuenta_glosas_principal 
                 (idcuenta, proveedor, estado, valor_glosado, fecha_radicacion)
@@ -389,4 +885,3 @@ class DatabaseManagerGlosas(DatabaseManager):
                 valor_glosado,
                 fecha_radicacion
             ))
-            conn.commit()
\ No newline at end of file
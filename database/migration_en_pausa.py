@@ -5,6 +5,7 @@ Ejecutar UNA VEZ antes de usar el módulo EN PAUSA.
 """
 
 import sqlite3
+import json
 import os
 import logging
 from config.settings import Settings
@@ -19,12 +20,14 @@ def migrar_bd_para_en_pausa():
     print("✅ OBJETIVO: Añadir soporte completo para reprocesamiento")
     print("="*60)
     
+    conn = None
     try:
-        # Conectar a la base de datos
+        # Conectar a la base de datos. isolation_level=None: la transacción
+        # se abre explícitamente (BEGIN EXCLUSIVE) y abarca toda la migración
         db_path = Settings.DATABASE_PATH
         print(f"📂 Conectando a: {db_path}")
         
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path, isolation_level=None)
         conn.row_factory = sqlite3.Row
         
         print("✅ Conexión exitosa")
@@ -58,6 +61,12 @@ def migrar_bd_para_en_pausa():
         for nombre in columnas_actuales.keys():
             print(f"   • {nombre}")
         
+        # Pasos 2-7 en una sola transacción exclusiva: un único commit en
+        # lugar de uno por ALTER/UPDATE/CREATE INDEX, y sin fsync durante la
+        # migración (si falla, el ROLLBACK deja la BD como estaba)
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("BEGIN EXCLUSIVE")
+        
         # ===================================
         # PASO 2: Añadir columna 'intentos' si no existe
         # ===================================
@@ -148,15 +157,46 @@ def migrar_bd_para_en_pausa():
         # ===================================
         print("\n🔍 PASO 6: Creando índices optimizados para EN PAUSA")
         
+        # 'procesabilidad' como columna generada en lugar del CASE de la
+        # vista, para poder indexarla. Mismo criterio que
+        # CuentaGlosasPrincipal.get_procesabilidad y migration_intentos.
+        # SQLite solo admite añadir columnas generadas VIRTUAL con ALTER
+        # TABLE; el índice materializa el valor.
+        # PRAGMA table_info omite las columnas generadas: usar table_xinfo
+        cursor = conn.execute("""
+            SELECT 1 FROM pragma_table_xinfo('cuenta_glosas_principal')
+            WHERE name = 'procesabilidad'
+        """)
+        
+        if cursor.fetchone() is None:
+            conn.execute("""
+                ALTER TABLE cuenta_glosas_principal 
+                ADD COLUMN procesabilidad TEXT GENERATED ALWAYS AS (
+                    CASE 
+                        WHEN estado = 'COMPLETADO' THEN 'COMPLETADO'
+                        WHEN estado = 'FALLA_TOTAL' OR intentos >= 5 THEN 'NO_PROCESABLE'
+                        WHEN estado IN ('FALLIDO', 'EN_PROCESO') THEN 'PROCESABLE'
+                        ELSE 'OTRO'
+                    END
+                ) VIRTUAL
+            """)
+            print("   ✅ Columna generada 'procesabilidad' añadida")
+        
         indices_en_pausa = [
-            ("CREATE INDEX IF NOT EXISTS idx_estado_intentos ON cuenta_glosas_principal(estado, intentos)", 
-             "Índice para filtrar por estado e intentos"),
-            ("CREATE INDEX IF NOT EXISTS idx_intentos ON cuenta_glosas_principal(intentos)", 
-             "Índice para ordenar por intentos"),
-            ("CREATE INDEX IF NOT EXISTS idx_fecha_intentos ON cuenta_glosas_principal(fecha_inicio, intentos)", 
-             "Índice para ordenar por fecha e intentos")
+            ("CREATE INDEX IF NOT EXISTS idx_cuenta_pendiente ON cuenta_glosas_principal(created_at) WHERE estado IN ('PENDIENTE', 'FALLIDO')", 
+             "Índice parcial para la cola de cuentas pendientes"),
+            ("CREATE INDEX IF NOT EXISTS idx_procesabilidad ON cuenta_glosas_principal(procesabilidad, intentos DESC, fecha_inicio DESC)", 
+             "Índice para filtrar por procesabilidad ordenado por intentos y fecha"),
+            ("CREATE INDEX IF NOT EXISTS idx_estado_intentos_fecha ON cuenta_glosas_principal(estado, intentos, fecha_inicio)", 
+             "Índice para filtrar por estado e intentos y ordenar por fecha")
         ]
         
+        # Las consultas EN PAUSA siempre filtran primero por estado: el índice
+        # compuesto cubre a los tres anteriores, que solo encarecían cada
+        # INSERT/UPDATE. Se eliminan si quedaron de una migración previa
+        for indice in ('idx_estado_intentos', 'idx_intentos', 'idx_fecha_intentos'):
+            conn.execute(f"DROP INDEX IF EXISTS {indice}")
+        
         for sql, descripcion in indices_en_pausa:
             try:
                 conn.execute(sql)
@@ -169,8 +209,10 @@ def migrar_bd_para_en_pausa():
         # ===================================
         print("\n👁️ PASO 7: Creando vista específica para EN PAUSA")
         
+        # Recrear siempre: las BD ya migradas tienen la vista con el CASE
+        conn.execute("DROP VIEW IF EXISTS vw_cuentas_en_pausa")
         conn.execute("""
-            CREATE VIEW IF NOT EXISTS vw_cuentas_en_pausa AS
+            CREATE VIEW vw_cuentas_en_pausa AS
             SELECT 
                 idcuenta,
                 proveedor,
@@ -180,11 +222,7 @@ def migrar_bd_para_en_pausa():
                 glosas_procesadas,
                 fecha_inicio,
                 motivo_fallo,
-                CASE 
-                    WHEN intentos >= 5 THEN 'NO_PROCESABLE'
-                    WHEN estado IN ('FALLIDO', 'EN_PROCESO') AND intentos < 5 THEN 'PROCESABLE'
-                    ELSE 'OTRO'
-                END as procesabilidad
+                procesabilidad
             FROM cuenta_glosas_principal 
             WHERE estado IN ('FALLIDO', 'EN_PROCESO', 'FALLA_TOTAL')
             ORDER BY intentos DESC, fecha_inicio DESC
@@ -192,11 +230,20 @@ def migrar_bd_para_en_pausa():
         
         print("✅ Vista 'vw_cuentas_en_pausa' creada")
         
+        # Estadísticas para que el planificador elija los índices nuevos
+        # (parciales y compuesto) en lugar de recorrer la tabla
+        conn.execute("ANALYZE cuenta_glosas_principal")
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'glosa_items_detalle'"
+        ).fetchone():
+            conn.execute("ANALYZE glosa_items_detalle")
+        
         # ===================================
         # FINALIZAR MIGRACIÓN
         # ===================================
-        conn.commit()
-        conn.close()
+        conn.execute("COMMIT")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA optimize")
         
         print("\n🎉 === MIGRACIÓN COMPLETADA EXITOSAMENTE ===")
         print("="*60)
@@ -210,8 +257,16 @@ def migrar_bd_para_en_pausa():
         return True
         
     except Exception as e:
+        if conn is not None and conn.in_transaction:
+            conn.execute("ROLLBACK")
         print(f"❌ ERROR EN MIGRACIÓN: {e}")
         return False
+    
+    finally:
+        # También en los return anticipados; cerrar con la transacción
+        # abierta la deshace
+        if conn is not None:
+            conn.close()
 
 def verificar_configuracion_en_pausa():
     """Verifica que la configuración EN PAUSA esté correcta."""
@@ -219,34 +274,43 @@ def verificar_configuracion_en_pausa():
     print("\n🔍 === VERIFICACIÓN DE CONFIGURACIÓN EN PAUSA ===")
     print("-"*50)
     
+    conn = None
     try:
         conn = sqlite3.connect(Settings.DATABASE_PATH)
         conn.row_factory = sqlite3.Row
         
-        # Verificar estructura
-        cursor = conn.execute("PRAGMA table_info(cuenta_glosas_principal)")
-        columnas = [row['name'] for row in cursor.fetchall()]
+        # Estructura y datos en una sola consulta: la lista de columnas sale
+        # de pragma_table_info como array JSON junto a las estadísticas
+        try:
+            stats = conn.execute("""
+                SELECT 
+                    (SELECT json_group_array(name)
+                     FROM pragma_table_info('cuenta_glosas_principal')) as cols,
+                    COUNT(*) as total,
+                    SUM(CASE WHEN estado IN ('FALLIDO', 'EN_PROCESO') AND intentos < 5 THEN 1 ELSE 0 END) as procesables,
+                    SUM(CASE WHEN estado = 'FALLA_TOTAL' OR intentos >= 5 THEN 1 ELSE 0 END) as no_procesables
+                FROM cuenta_glosas_principal
+            """).fetchone()
+        except sqlite3.OperationalError:
+            # Sin la columna 'intentos' las estadísticas no compilan;
+            # consultar solo la estructura para informar qué falta
+            stats = None
+            columnas = json.loads(conn.execute(
+                "SELECT json_group_array(name) "
+                "FROM pragma_table_info('cuenta_glosas_principal')"
+            ).fetchone()[0])
+        else:
+            columnas = json.loads(stats['cols'])
         
         requisitos = ['intentos', 'estado', 'motivo_fallo', 'fecha_inicio']
         faltantes = [req for req in requisitos if req not in columnas]
         
-        if faltantes:
+        if faltantes or stats is None:
             print(f"❌ FALTAN COLUMNAS: {faltantes}")
             return False
         
         print("✅ Estructura de tabla correcta")
         
-        # Verificar datos
-        cursor = conn.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN estado IN ('FALLIDO', 'EN_PROCESO') AND intentos < 5 THEN 1 ELSE 0 END) as procesables,
-                SUM(CASE WHEN estado = 'FALLA_TOTAL' OR intentos >= 5 THEN 1 ELSE 0 END) as no_procesables
-            FROM cuenta_glosas_principal
-        """)
-        
-        stats = cursor.fetchone()
-        
         print(f"📊 ESTADÍSTICAS ACTUALES:")
         print(f"   • Total registros: {stats['total']}")
         print(f"   • Procesables EN PAUSA: {stats['procesables']}")
@@ -262,14 +326,16 @@ def verificar_configuracion_en_pausa():
             print(f"❌ Error en vista EN PAUSA: {e}")
             return False
         
-        conn.close()
-        
         print("✅ CONFIGURACIÓN EN PAUSA VERIFICADA CORRECTAMENTE")
         return True
         
     except Exception as e:
         print(f"❌ Error en verificación: {e}")
         return False
+    
+    finally:
+        if conn is not None:
+            conn.close()
 
 def main():
     """Función principal de migración."""
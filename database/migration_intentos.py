@@ -6,223 +6,369 @@ en el módulo Glosas en Pausa.
 
 import sqlite3
 import os
+import sys
 import logging
+from typing import List, Optional
 from config.settings import Settings
 
-def migrar_campo_intentos():
+# Vista EN PAUSA. Se calcula al leerla: ningún código de la aplicación la
+# consulta en caliente y así cada cambio de estado/intentos no paga la
+# escritura de una tabla materializada
+_SQL_CREATE_VIEW = """
+    CREATE VIEW vw_glosas_en_pausa AS
+    SELECT 
+        idcuenta,
+        proveedor,
+        estado,
+        intentos,
+        glosas_encontradas,
+        glosas_procesadas,
+        fecha_inicio,
+        motivo_fallo,
+        valor_glosado,
+        procesabilidad,
+        CASE 
+            WHEN intentos = 0 THEN 'PRIMER_INTENTO'
+            WHEN intentos BETWEEN 1 AND 2 THEN 'INTENTOS_TEMPRANOS'
+            WHEN intentos BETWEEN 3 AND 4 THEN 'INTENTOS_TARDIOS'
+            WHEN intentos >= 5 THEN 'LIMITE_ALCANZADO'
+            ELSE 'DESCONOCIDO'
+        END as categoria_intentos
+    FROM cuenta_glosas_principal 
+    WHERE estado IN ('FALLIDO', 'EN_PROCESO')
+    ORDER BY intentos ASC, fecha_inicio DESC
+"""
+
+# Restos de la tabla materializada de versiones anteriores: sus triggers
+# añadían un DELETE y un INSERT a cada actualización de cuenta
+_SQL_DROP_MV = (
+    "DROP TRIGGER IF EXISTS trg_mv_glosas_en_pausa_ins",
+    "DROP TRIGGER IF EXISTS trg_mv_glosas_en_pausa_upd",
+    "DROP TRIGGER IF EXISTS trg_mv_glosas_en_pausa_del",
+    "DROP TABLE IF EXISTS mv_glosas_en_pausa",
+)
+
+# procesabilidad como columna generada (mismo criterio que
+# CuentaGlosasPrincipal.get_procesabilidad): se puede indexar y ni la
+# vista ni las consultas repiten el CASE. SQLite solo admite añadir
+# columnas generadas VIRTUAL con ALTER TABLE; el índice guarda el valor
+_SQL_ADD_PROCESABILIDAD = """
+    ALTER TABLE cuenta_glosas_principal 
+    ADD COLUMN procesabilidad TEXT GENERATED ALWAYS AS (
+        CASE 
+            WHEN estado = 'COMPLETADO' THEN 'COMPLETADO'
+            WHEN estado = 'FALLA_TOTAL' OR intentos >= 5 THEN 'NO_PROCESABLE'
+            WHEN estado IN ('FALLIDO', 'EN_PROCESO') THEN 'PROCESABLE'
+            ELSE 'OTRO'
+        END
+    ) VIRTUAL
+"""
+
+def _volcar(salida: List[str]) -> None:
+    """
+    Escribe de una vez las líneas de progreso acumuladas y vacía la lista.
+    
+    Un print por línea es una escritura (y un flush en terminal) por línea;
+    cada PASO acumula su salida y se vuelca en un solo write al terminar, y
+    antes de las operaciones largas para que el progreso se vea a tiempo.
+    """
+    if salida:
+        sys.stdout.write("\n".join(salida) + "\n")
+        sys.stdout.flush()
+        salida.clear()
+
+def _conectar() -> sqlite3.Connection:
+    """
+    Abre una conexión a la BD configurada para la migración.
+    
+    Returns:
+        sqlite3.Connection: Conexión con los PRAGMA aplicados; las filas son
+        tuplas y las consultas se desempaquetan por posición
+    """
+    conn = sqlite3.connect(Settings.DATABASE_PATH)
+    
+    # Mismos ajustes que DatabaseManagerGlosas: WAL + synchronous=NORMAL
+    # solo hace fsync al hacer checkpoint, no en cada sentencia
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    
+    return conn
+
+def _cerrar(conn: sqlite3.Connection) -> None:
+    """Cierra la conexión dejando antes las estadísticas del planificador al día."""
+    # Con los índices recién creados, optimize corre ANALYZE sobre ellos
+    # y el planificador tiene estadísticas para usarlos desde la vista
+    conn.execute("PRAGMA optimize")
+    conn.close()
+
+def migrar_campo_intentos(conn: Optional[sqlite3.Connection] = None):
     """
     Migra la base de datos para soportar el campo 'intentos' 
     necesario para el módulo Glosas en Pausa.
+    
+    Args:
+        conn (sqlite3.Connection, optional): Conexión a reutilizar; si no se
+            pasa, se abre una propia y se cierra al terminar
     """
     
-    print("🔧 === MIGRACIÓN CAMPO INTENTOS PARA GLOSAS EN PAUSA ===")
-    print("✅ OBJETIVO: Añadir soporte completo para control de intentos")
-    print("="*60)
+    salida = []
+    out = salida.append
+    
+    out("🔧 === MIGRACIÓN CAMPO INTENTOS PARA GLOSAS EN PAUSA ===")
+    out("✅ OBJETIVO: Añadir soporte completo para control de intentos")
+    out("="*60)
     
+    propia = conn is None
     try:
         # Conectar a la base de datos
-        db_path = Settings.DATABASE_PATH
-        print(f"📂 Conectando a: {db_path}")
+        if propia:
+            out(f"📂 Conectando a: {Settings.DATABASE_PATH}")
+            conn = _conectar()
         
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        
-        print("✅ Conexión exitosa")
-        print("-"*40)
+        out("✅ Conexión exitosa")
+        out("-"*40)
         
         # ===================================
         # PASO 1: Verificar tabla principal
         # ===================================
-        print("🔍 PASO 1: Verificando tabla principal")
+        out("🔍 PASO 1: Verificando tabla principal")
         
+        # Una sola consulta de metadatos: sin filas la tabla no existe, con
+        # filas ya da las columnas que usa el paso 2 (table_xinfo incluye
+        # las columnas generadas, que table_info omite)
         cursor = conn.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name='cuenta_glosas_principal'
+            SELECT name FROM pragma_table_xinfo('cuenta_glosas_principal')
         """)
         
-        tabla_existe = cursor.fetchone()
+        columnas_actuales = {row[0] for row in cursor}
         
-        if not tabla_existe:
-            print("❌ ERROR: Tabla 'cuenta_glosas_principal' no existe")
-            print("   Ejecute primero el procesador principal para crear las tablas")
+        if not columnas_actuales:
+            out("❌ ERROR: Tabla 'cuenta_glosas_principal' no existe")
+            out("   Ejecute primero el procesador principal para crear las tablas")
             return False
         
-        print("✅ Tabla 'cuenta_glosas_principal' existe")
+        out("✅ Tabla 'cuenta_glosas_principal' existe")
+        
+        # Pasos 2-5 se arman como un único script SQL que se ejecuta de una
+        # vez con executescript: un solo lote de sentencias dentro de una
+        # transacción (BEGIN IMMEDIATE ... COMMIT). Si algo falla, la BD
+        # queda como estaba
+        script = []
+        
+        _volcar(salida)
         
         # ===================================
         # PASO 2: Verificar campo intentos
         # ===================================
-        print("\n🔧 PASO 2: Verificando campo 'intentos'")
+        out("\n🔧 PASO 2: Verificando campo 'intentos'")
         
-        cursor = conn.execute("PRAGMA table_info(cuenta_glosas_principal)")
-        columnas_actuales = {row['name']: row for row in cursor.fetchall()}
-        
-        print(f"📋 Columnas actuales: {len(columnas_actuales)}")
+        out(f"📋 Columnas actuales: {len(columnas_actuales)}")
         
         if 'intentos' not in columnas_actuales:
-            print("➕ Añadiendo campo 'intentos'...")
-            
-            conn.execute("""
+            out("➕ Se añadirá el campo 'intentos'")
+            script.append("""
                 ALTER TABLE cuenta_glosas_principal 
-                ADD COLUMN intentos INTEGER DEFAULT 0
+                ADD COLUMN intentos INTEGER DEFAULT 0 
+                CHECK (intentos >= 0 AND intentos <= 100)
             """)
-            
-            print("✅ Campo 'intentos' añadido exitosamente")
         else:
-            print("✅ Campo 'intentos' ya existe")
+            out("✅ Campo 'intentos' ya existe")
+        
+        _volcar(salida)
         
         # ===================================
         # PASO 3: Inicializar valores
         # ===================================
-        print("\n🔢 PASO 3: Inicializando valores de intentos")
+        out("\n🔢 PASO 3: Inicializando valores de intentos")
+        
+        # ADD COLUMN ... DEFAULT 0 ya deja en 0 las filas existentes: solo se
+        # recorre la tabla con el UPDATE si de verdad queda algún NULL
+        sin_intentos = 0
+        if 'intentos' in columnas_actuales:
+            sin_intentos = conn.execute("""
+                SELECT COUNT(*) FROM cuenta_glosas_principal 
+                WHERE intentos IS NULL
+            """).fetchone()[0]
+        
+        if sin_intentos:
+            out(f"➕ Se inicializarán intentos para {sin_intentos} registros")
+            script.append("""
+                UPDATE cuenta_glosas_principal 
+                SET intentos = 0 
+                WHERE intentos IS NULL
+            """)
+        else:
+            out("✅ Todos los registros ya tienen intentos inicializados")
         
-        cursor = conn.execute("""
-            UPDATE cuenta_glosas_principal 
-            SET intentos = 0 
-            WHERE intentos IS NULL
-        """)
+        if 'procesabilidad' not in columnas_actuales:
+            out("➕ Se añadirá la columna generada 'procesabilidad'")
+            script.append(_SQL_ADD_PROCESABILIDAD)
         
-        if cursor.rowcount > 0:
-            print(f"✅ Inicializados intentos para {cursor.rowcount} registros")
-        else:
-            print("✅ Todos los registros ya tienen intentos inicializados")
+        _volcar(salida)
         
         # ===================================
         # PASO 4: Crear índices optimizados
         # ===================================
-        print("\n🔍 PASO 4: Creando índices optimizados")
+        # Siempre después del UPDATE del paso 3: así cada índice se
+        # construye una sola vez sobre los datos finales en lugar de
+        # mantenerse fila a fila durante la inicialización
+        out("\n🔍 PASO 4: Creando índices optimizados")
         
         indices_intentos = [
-            ("CREATE INDEX IF NOT EXISTS idx_estado_intentos ON cuenta_glosas_principal(estado, intentos)", 
-             "Índice para filtrar por estado e intentos"),
-            ("CREATE INDEX IF NOT EXISTS idx_intentos ON cuenta_glosas_principal(intentos)", 
-             "Índice para ordenar por intentos"),
-            ("CREATE INDEX IF NOT EXISTS idx_fallidas_en_proceso ON cuenta_glosas_principal(estado) WHERE estado IN ('FALLIDO', 'EN_PROCESO')", 
+            ("CREATE INDEX IF NOT EXISTS idx_estado_intentos_fecha ON cuenta_glosas_principal(estado, intentos, fecha_inicio)", 
+             "Índice para filtrar por estado e intentos y ordenar por fecha"),
+            ("CREATE INDEX IF NOT EXISTS idx_procesabilidad ON cuenta_glosas_principal(procesabilidad, intentos DESC, fecha_inicio DESC)", 
+             "Índice para filtrar por procesabilidad"),
+            ("CREATE INDEX IF NOT EXISTS idx_fallidas_en_pausa ON cuenta_glosas_principal(intentos ASC, fecha_inicio DESC, idcuenta, proveedor, estado, glosas_encontradas, glosas_procesadas, valor_glosado, motivo_fallo) WHERE estado IN ('FALLIDO', 'EN_PROCESO')", 
              "Índice específico para EN PAUSA")
         ]
         
+        # idx_fallidas_en_pausa sigue el orden y cubre todas las columnas que
+        # vw_glosas_en_pausa (lectura solo del índice, sin ordenar); el
+        # parcial anterior sobre estado queda obsoleto. Mismo índice
+        # compuesto que migration_en_pausa: idx_estado_intentos_fecha
+        # sustituye a idx_estado_intentos, idx_intentos e idx_fecha_intentos
+        # (las consultas siempre filtran antes por estado)
+        script.append("DROP INDEX IF EXISTS idx_fallidas_en_proceso")
+        for indice in ('idx_estado_intentos', 'idx_intentos', 'idx_fecha_intentos'):
+            script.append(f"DROP INDEX IF EXISTS {indice}")
+        
         for sql, descripcion in indices_intentos:
-            try:
-                conn.execute(sql)
-                print(f"   ✅ {descripcion}")
-            except Exception as e:
-                print(f"   ⚠️ {descripcion}: {e}")
+            script.append(sql)
+            out(f"   • {descripcion}")
+        
+        _volcar(salida)
         
         # ===================================
         # PASO 5: Crear vista específica
         # ===================================
-        print("\n👁️ PASO 5: Creando vista para Glosas en Pausa")
+        out("\n👁️ PASO 5: Creando vista para Glosas en Pausa")
+        
+        # Recrear siempre: las BD ya migradas pueden tener la vista con el
+        # CASE de procesabilidad o la tabla materializada con sus triggers
+        script.extend(_SQL_DROP_MV)
+        script.append("DROP VIEW IF EXISTS vw_glosas_en_pausa")
+        script.append(_SQL_CREATE_VIEW)
+        
+        # Mostrar los pasos 4-5 antes de ejecutar el script, la parte larga
+        _volcar(salida)
+        
+        # Los índices recorren la tabla varias veces seguidas: con
+        # 128MB de caché la tabla queda en memoria entre un recorrido y el
+        # siguiente, y solo el primero lee de disco
+        cache_anterior = conn.execute("PRAGMA cache_size").fetchone()[0]
+        conn.execute("PRAGMA cache_size=-131072")
+        try:
+            conn.executescript(
+                "BEGIN IMMEDIATE;\n" + ";\n".join(script) + ";\nCOMMIT;"
+            )
+        finally:
+            conn.execute(f"PRAGMA cache_size={int(cache_anterior)}")
         
-        conn.execute("""
-            CREATE VIEW IF NOT EXISTS vw_glosas_en_pausa AS
-            SELECT 
-                idcuenta,
-                proveedor,
-                estado,
-                intentos,
-                glosas_encontradas,
-                glosas_procesadas,
-                fecha_inicio,
-                motivo_fallo,
-                valor_glosado,
-                CASE 
-                    WHEN intentos >= 5 THEN 'NO_PROCESABLE'
-                    WHEN estado IN ('FALLIDO', 'EN_PROCESO') AND intentos < 5 THEN 'PROCESABLE'
-                    ELSE 'OTRO'
-                END as procesabilidad,
-                CASE 
-                    WHEN intentos = 0 THEN 'PRIMER_INTENTO'
-                    WHEN intentos BETWEEN 1 AND 2 THEN 'INTENTOS_TEMPRANOS'
-                    WHEN intentos BETWEEN 3 AND 4 THEN 'INTENTOS_TARDIOS'
-                    WHEN intentos >= 5 THEN 'LIMITE_ALCANZADO'
-                    ELSE 'DESCONOCIDO'
-                END as categoria_intentos
-            FROM cuenta_glosas_principal 
-            WHERE estado IN ('FALLIDO', 'EN_PROCESO')
-            ORDER BY intentos ASC, fecha_inicio DESC
-        """)
+        out("✅ Campo, índices y vista 'vw_glosas_en_pausa' aplicados")
         
-        print("✅ Vista 'vw_glosas_en_pausa' creada")
+        _volcar(salida)
         
         # ===================================
         # PASO 6: Verificar datos existentes
         # ===================================
-        print("\n📊 PASO 6: Verificando datos existentes")
+        out("\n📊 PASO 6: Verificando datos existentes")
         
+        # Una sola pasada: la procesabilidad EN PAUSA sale de los mismos
+        # grupos por estado en lugar de releer la vista
         cursor = conn.execute("""
             SELECT 
                 estado,
                 COUNT(*) as total,
+                COUNT(*) FILTER (WHERE COALESCE(intentos, 0) < 5) as procesables,
+                COUNT(*) FILTER (WHERE COALESCE(intentos, 0) >= 5) as no_procesables,
                 AVG(COALESCE(intentos, 0)) as promedio_intentos,
                 MAX(COALESCE(intentos, 0)) as max_intentos
             FROM cuenta_glosas_principal 
             GROUP BY estado
         """)
         
-        print("Estado actual de la base de datos:")
-        for row in cursor.fetchall():
-            estado = row['estado']
-            total = row['total']
-            promedio = row['promedio_intentos']
-            maximo = row['max_intentos']
-            print(f"   • {estado}: {total} registros (promedio intentos: {promedio:.1f}, máx: {maximo})")
+        procesabilidad = {'PROCESABLE': 0, 'NO_PROCESABLE': 0}
         
-        # Verificar vista específica
-        cursor = conn.execute("""
-            SELECT 
-                procesabilidad,
-                COUNT(*) as count
-            FROM vw_glosas_en_pausa 
-            GROUP BY procesabilidad
-        """)
+        out("Estado actual de la base de datos:")
+        for estado, total, procesables, no_procesables, promedio, maximo in cursor:
+            out(f"   • {estado}: {total} registros (promedio intentos: {promedio:.1f}, máx: {maximo})")
+            
+            # Mismo criterio que vw_glosas_en_pausa
+            if estado in ('FALLIDO', 'EN_PROCESO'):
+                procesabilidad['PROCESABLE'] += procesables
+                procesabilidad['NO_PROCESABLE'] += no_procesables
+        
+        out("\nEstado de procesabilidad EN PAUSA:")
+        for tipo, count in procesabilidad.items():
+            if count:
+                out(f"   • {tipo}: {count} cuentas")
         
-        print("\nEstado de procesabilidad EN PAUSA:")
-        for row in cursor.fetchall():
-            print(f"   • {row['procesabilidad']}: {row['count']} cuentas")
+        _volcar(salida)
         
         # ===================================
         # FINALIZAR MIGRACIÓN
         # ===================================
-        conn.commit()
-        conn.close()
-        
-        print("\n🎉 === MIGRACIÓN COMPLETADA EXITOSAMENTE ===")
-        print("="*60)
-        print("✅ Campo 'intentos' verificado/añadido")
-        print("✅ Valores inicializados correctamente")
-        print("✅ Índices optimizados creados")
-        print("✅ Vista EN PAUSA creada")
-        print("✅ Base de datos lista para módulo Glosas en Pausa")
-        print("\n💡 Ahora puede usar el módulo Glosas en Pausa sin problemas")
+        out("\n🎉 === MIGRACIÓN COMPLETADA EXITOSAMENTE ===")
+        out("="*60)
+        out("✅ Campo 'intentos' verificado/añadido")
+        out("✅ Valores inicializados correctamente")
+        out("✅ Índices optimizados creados")
+        out("✅ Vista EN PAUSA creada")
+        out("✅ Base de datos lista para módulo Glosas en Pausa")
+        out("\n💡 Ahora puede usar el módulo Glosas en Pausa sin problemas")
         
         return True
         
     except Exception as e:
-        print(f"❌ ERROR EN MIGRACIÓN: {e}")
+        if conn is not None:
+            conn.rollback()
+        out(f"❌ ERROR EN MIGRACIÓN: {e}")
         return False
+    
+    finally:
+        _volcar(salida)
+        if propia and conn is not None:
+            _cerrar(conn)
 
-def verificar_configuracion_glosas_en_pausa():
-    """Verifica que la configuración esté correcta para Glosas en Pausa."""
+def verificar_configuracion_glosas_en_pausa(conn: Optional[sqlite3.Connection] = None):
+    """
+    Verifica que la configuración esté correcta para Glosas en Pausa.
+    
+    Args:
+        conn (sqlite3.Connection, optional): Conexión a reutilizar; si no se
+            pasa, se abre una propia y se cierra al terminar
+    """
+    
+    salida = []
+    out = salida.append
     
-    print("\n🔍 === VERIFICACIÓN GLOSAS EN PAUSA ===")
-    print("-"*50)
+    out("\n🔍 === VERIFICACIÓN GLOSAS EN PAUSA ===")
+    out("-"*50)
     
+    propia = conn is None
     try:
-        conn = sqlite3.connect(Settings.DATABASE_PATH)
-        conn.row_factory = sqlite3.Row
+        if propia:
+            out(f"📂 Conectando a: {Settings.DATABASE_PATH}")
+            conn = _conectar()
         
         # Verificar estructura
-        cursor = conn.execute("PRAGMA table_info(cuenta_glosas_principal)")
-        columnas = [row['name'] for row in cursor.fetchall()]
+        cursor = conn.execute(
+            "SELECT name FROM pragma_table_info('cuenta_glosas_principal')"
+        )
+        columnas = [row[0] for row in cursor]
         
         requisitos = ['intentos', 'estado', 'motivo_fallo']
         faltantes = [req for req in requisitos if req not in columnas]
         
         if faltantes:
-            print(f"❌ FALTAN COLUMNAS: {faltantes}")
+            out(f"❌ FALTAN COLUMNAS: {faltantes}")
             return False
         
-        print("✅ Estructura de tabla correcta")
+        out("✅ Estructura de tabla correcta")
         
         # Verificar datos específicos para EN PAUSA
         cursor = conn.execute("""
@@ -234,51 +380,66 @@ def verificar_configuracion_glosas_en_pausa():
             FROM cuenta_glosas_principal
         """)
         
-        stats = cursor.fetchone()
+        total, procesables, no_procesables, completadas = cursor.fetchone()
         
-        print(f"📊 ESTADÍSTICAS PARA GLOSAS EN PAUSA:")
-        print(f"   • Total registros: {stats['total']}")
-        print(f"   • Procesables EN PAUSA: {stats['procesables']}")
-        print(f"   • No procesables (5+ intentos): {stats['no_procesables']}")
-        print(f"   • Completadas: {stats['completadas']}")
+        out(f"📊 ESTADÍSTICAS PARA GLOSAS EN PAUSA:")
+        out(f"   • Total registros: {total}")
+        out(f"   • Procesables EN PAUSA: {procesables}")
+        out(f"   • No procesables (5+ intentos): {no_procesables}")
+        out(f"   • Completadas: {completadas}")
         
         # Verificar vista
         try:
             cursor = conn.execute("SELECT COUNT(*) FROM vw_glosas_en_pausa")
             vista_count = cursor.fetchone()[0]
-            print(f"   • Registros en vista EN PAUSA: {vista_count}")
-            print("✅ Vista EN PAUSA funcional")
+            out(f"   • Registros en vista EN PAUSA: {vista_count}")
+            out("✅ Vista EN PAUSA funcional")
         except Exception as e:
-            print(f"❌ Error en vista EN PAUSA: {e}")
+            out(f"❌ Error en vista EN PAUSA: {e}")
             return False
         
-        conn.close()
-        
-        print("✅ CONFIGURACIÓN GLOSAS EN PAUSA VERIFICADA")
+        out("✅ CONFIGURACIÓN GLOSAS EN PAUSA VERIFICADA")
         return True
         
     except Exception as e:
-        print(f"❌ Error en verificación: {e}")
+        out(f"❌ Error en verificación: {e}")
         return False
+    
+    finally:
+        _volcar(salida)
+        if propia and conn is not None:
+            _cerrar(conn)
 
 def main():
     """Función principal de migración."""
-    print("🚀 CONFIGURADOR GLOSAS EN PAUSA")
-    print("="*50)
+    salida = []
+    out = salida.append
+    
+    out("🚀 CONFIGURADOR GLOSAS EN PAUSA")
+    out("="*50)
+    out(f"📂 Conectando a: {Settings.DATABASE_PATH}")
     
-    # Migrar base de datos
-    if migrar_campo_intentos():
-        # Verificar configuración
-        verificar_configuracion_glosas_en_pausa()
-        
-        print("\n🎯 PRÓXIMOS PASOS:")
-        print("1. ✅ Migración completada")
-        print("2. 🔄 Ejecutar módulo Glosas en Pausa desde la interfaz")
-        print("3. 📊 Verificar reprocesamiento de cuentas fallidas")
-        print("\n🎉 ¡Listo para usar Glosas en Pausa!")
-    else:
-        print("\n❌ MIGRACIÓN FALLIDA")
-        print("Revise los errores anteriores antes de continuar")
+    # Una sola conexión para migrar y verificar: la caché de páginas que
+    # calienta la migración la aprovecha la verificación
+    conn = _conectar()
+    _volcar(salida)
+    try:
+        # Migrar base de datos
+        if migrar_campo_intentos(conn):
+            # Verificar configuración
+            verificar_configuracion_glosas_en_pausa(conn)
+            
+            out("\n🎯 PRÓXIMOS PASOS:")
+            out("1. ✅ Migración completada")
+            out("2. 🔄 Ejecutar módulo Glosas en Pausa desde la interfaz")
+            out("3. 📊 Verificar reprocesamiento de cuentas fallidas")
+            out("\n🎉 ¡Listo para usar Glosas en Pausa!")
+        else:
+            out("\n❌ MIGRACIÓN FALLIDA")
+            out("Revise los errores anteriores antes de continuar")
+    finally:
+        _volcar(salida)
+        _cerrar(conn)
 
 if __name__ == "__main__":
     # Configurar logging básico
@@ -1,11 +1,16 @@
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Cliente:
     """
     Modelo de datos para la tabla Cliente.
     Representa la estructura de un cliente en la base de datos.
+    
+    El orden de los campos coincide con el de las columnas de la tabla, de
+    modo que una fila (id, nombre, nit, correo, telefono) se convierte con
+    ``Cliente(*row)``.
     """
     id: Optional[int] = None
     nombre: str = ""
@@ -32,4 +37,26 @@ class Cliente:
             nit=data.get('nit', ''),
             correo=data.get('correo', ''),
             telefono=data.get('telefono', '')
-        )
\ No newline at end of file
+        )
+
+
+class ClienteRow(tuple):
+    """
+    Fila de cliente tal como la devuelve la base de datos.
+    
+    Tupla (id, nombre, nit, correo, telefono) con acceso por atributo; se
+    crea sin pasar por __init__ de Python, por lo que es más barata que un
+    Cliente cuando solo se leen algunos campos. Usar to_cliente() cuando se
+    necesite un objeto modificable.
+    """
+    __slots__ = ()
+    
+    id = property(itemgetter(0))
+    nombre = property(itemgetter(1))
+    nit = property(itemgetter(2))
+    correo = property(itemgetter(3))
+    telefono = property(itemgetter(4))
+    
+    def to_cliente(self) -> Cliente:
+        """Convierte la fila en un Cliente."""
+        return Cliente(*self)
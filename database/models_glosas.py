@@ -1,10 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, field, fields
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
 
-class EstadoCuenta(Enum):
-    """Estados posibles de una cuenta de glosas."""
+class EstadoCuenta(str, Enum):
+    """
+    Estados posibles de una cuenta de glosas.
+    
+    Mezcla con str: cada miembro ya es su valor como texto, se compara con
+    'PENDIENTE' directamente y se guarda en la BD sin pasar por .value.
+    """
     PENDIENTE = "PENDIENTE"
     EN_PROCESO = "EN_PROCESO"
     COMPLETADO = "COMPLETADO"
@@ -12,7 +17,13 @@ class EstadoCuenta(Enum):
     FALLA_TOTAL = "FALLA_TOTAL"  # ✅ NUEVO: Para 5+ intentos
 
 
-class TipoProcesabilidad(Enum):
+# Decodificación valor -> miembro con un solo acceso a dict, sin pasar por
+# EstadoCuenta(valor) en cada fila leída de la BD. Un valor desconocido se
+# lee como PENDIENTE, el estado por defecto de la cuenta
+_ESTADO_POR_VALOR = {e.value: e for e in EstadoCuenta}
+
+
+class TipoProcesabilidad(str, Enum):
     """
     Tipos de procesabilidad para módulo EN PAUSA.
     ✅ NUEVO: Para categorizar cuentas según su elegibilidad de reprocesamiento.
@@ -22,7 +33,96 @@ class TipoProcesabilidad(Enum):
     COMPLETADO = "COMPLETADO"          # Ya procesado exitosamente
     OTRO = "OTRO"  
 
-@dataclass
+
+# get_procesabilidad como tabla: (estado, intentos >= 5) -> tipo. Las
+# combinaciones ausentes (PENDIENTE con < 5 intentos) son OTRO
+_PROCESABILIDAD_TABLE = {
+    (EstadoCuenta.COMPLETADO, False): TipoProcesabilidad.COMPLETADO,
+    (EstadoCuenta.COMPLETADO, True): TipoProcesabilidad.COMPLETADO,
+    (EstadoCuenta.FALLA_TOTAL, False): TipoProcesabilidad.NO_PROCESABLE,
+    (EstadoCuenta.FALLA_TOTAL, True): TipoProcesabilidad.NO_PROCESABLE,
+    (EstadoCuenta.FALLIDO, False): TipoProcesabilidad.PROCESABLE,
+    (EstadoCuenta.FALLIDO, True): TipoProcesabilidad.NO_PROCESABLE,
+    (EstadoCuenta.EN_PROCESO, False): TipoProcesabilidad.PROCESABLE,
+    (EstadoCuenta.EN_PROCESO, True): TipoProcesabilidad.NO_PROCESABLE,
+    (EstadoCuenta.PENDIENTE, True): TipoProcesabilidad.NO_PROCESABLE,
+}
+
+
+def _dataclass_con_dict(cls):
+    """
+    Genera to_dict y from_dict a partir de los campos del dataclass.
+    
+    El código de ambos métodos se arma una sola vez al decorar la clase, con
+    los campos desenrollados (un dict literal y una llamada con argumentos
+    por nombre), y se compila con exec. Agregar un campo ya no obliga a
+    tocar los métodos. Los campos Enum se guardan en la BD por su valor (los
+    que mezclan str ya lo son) y se decodifican con su mapa valor -> miembro;
+    las claves ausentes (y en los Enum, los valores desconocidos) toman el
+    valor por defecto del campo.
+    
+    from_dict intenta primero con data[clave] para todos los campos (las
+    filas de la BD traen siempre todas las columnas) y solo si falta alguna
+    repite la construcción con los valores por defecto.
+    """
+    ns = {}
+    a_dict = []
+    desde_dict = []
+    completo = []
+    
+    for f in fields(cls):
+        if f.default is not MISSING:
+            defecto = f"data.get({f.name!r}, _def_{f.name})"
+            ns[f"_def_{f.name}"] = f.default
+        elif f.default_factory is not MISSING:
+            defecto = f"data[{f.name!r}] if {f.name!r} in data else _fab_{f.name}()"
+            ns[f"_fab_{f.name}"] = f.default_factory
+        else:
+            defecto = f"data[{f.name!r}]"
+        
+        if isinstance(f.type, type) and issubclass(f.type, Enum):
+            ns[f"_mapa_{f.name}"] = {m.value: m for m in f.type}
+            valor = "" if issubclass(f.type, str) else ".value"
+            a_dict.append(f"{f.name!r}: self.{f.name}{valor}")
+            if f.default is not MISSING:
+                desde_dict.append(
+                    f"{f.name}=_mapa_{f.name}.get(data.get({f.name!r}), _def_{f.name})"
+                )
+                completo.append(
+                    f"{f.name}=_mapa_{f.name}.get(data[{f.name!r}], _def_{f.name})"
+                )
+            else:
+                desde_dict.append(f"{f.name}=_mapa_{f.name}[{defecto}]")
+                completo.append(f"{f.name}=_mapa_{f.name}[data[{f.name!r}]]")
+        else:
+            a_dict.append(f"{f.name!r}: self.{f.name}")
+            desde_dict.append(f"{f.name}={defecto}")
+            completo.append(f"{f.name}=data[{f.name!r}]")
+    
+    fuente = (
+        "def to_dict(self):\n"
+        "    return {" + ", ".join(a_dict) + "}\n"
+        "def from_dict(cls, data):\n"
+        "    try:\n"
+        "        return cls(" + ", ".join(completo) + ")\n"
+        "    except KeyError:\n"
+        "        return cls(" + ", ".join(desde_dict) + ")\n"
+    )
+    exec(fuente, ns)
+    
+    to_dict, from_dict = ns["to_dict"], ns["from_dict"]
+    to_dict.__doc__ = "Convierte el objeto a diccionario para BD."
+    from_dict.__doc__ = "Crea una instancia desde diccionario de BD."
+    for metodo in (to_dict, from_dict):
+        metodo.__qualname__ = f"{cls.__qualname__}.{metodo.__name__}"
+        metodo.__module__ = cls.__module__
+    
+    cls.to_dict = to_dict
+    cls.from_dict = classmethod(from_dict)
+    return cls
+
+@_dataclass_con_dict
+@dataclass(slots=True)
 class CuentaGlosasPrincipal:
     """
     Modelo de datos para la tabla principal de cuentas de glosas.
@@ -48,49 +148,18 @@ class CuentaGlosasPrincipal:
     motivo_fallo: str = ""               # Si falló, descripción
     intentos: int = 0                    # Número de intentos de procesamiento
     
-    def to_dict(self) -> dict:
-        """Convierte el objeto a diccionario para BD."""
-        return {
-            'id': self.id,
-            'idcuenta': self.idcuenta,
-            'numero_radicacion': self.numero_radicacion,
-            'fecha_radicacion': self.fecha_radicacion,
-            'proveedor': self.proveedor,
-            'numero_factura': self.numero_factura,
-            'fecha_factura': self.fecha_factura,
-            'valor_factura': self.valor_factura,
-            'valor_glosado': self.valor_glosado,
-            'estado': self.estado.value,
-            'fecha_inicio': self.fecha_inicio,
-            'fecha_fin': self.fecha_fin,
-            'glosas_encontradas': self.glosas_encontradas,
-            'glosas_tarifas': self.glosas_tarifas,
-            'glosas_procesadas': self.glosas_procesadas,
-            'motivo_fallo': self.motivo_fallo,
-            'intentos': self.intentos
-        }
-    
     @classmethod
-    def from_dict(cls, data: dict) -> 'CuentaGlosasPrincipal':
-        """Crea una instancia desde diccionario de BD."""
+    def from_row(cls, row: tuple) -> 'CuentaGlosasPrincipal':
+        """
+        Crea una instancia desde una fila de BD sin pasar por un dict.
+        
+        La fila debe traer las columnas en el mismo orden que los campos
+        del dataclass (id, idcuenta, ..., intentos).
+        """
         return cls(
-            id=data.get('id'),
-            idcuenta=data.get('idcuenta', ''),
-            numero_radicacion=data.get('numero_radicacion', ''),
-            fecha_radicacion=data.get('fecha_radicacion', ''),
-            proveedor=data.get('proveedor', ''),
-            numero_factura=data.get('numero_factura', ''),
-            fecha_factura=data.get('fecha_factura', ''),
-            valor_factura=data.get('valor_factura', 0.0),
-            valor_glosado=data.get('valor_glosado', 0.0),
-            estado=EstadoCuenta(data.get('estado', 'PENDIENTE')),
-            fecha_inicio=data.get('fecha_inicio'),
-            fecha_fin=data.get('fecha_fin'),
-            glosas_encontradas=data.get('glosas_encontradas', 0),
-            glosas_tarifas=data.get('glosas_tarifas', 0),
-            glosas_procesadas=data.get('glosas_procesadas', 0),
-            motivo_fallo=data.get('motivo_fallo', ''),
-            intentos=data.get('intentos', 0)
+            *row[:9],
+            _ESTADO_POR_VALOR.get(row[9], EstadoCuenta.PENDIENTE),
+            *row[10:]
         )
     
     def es_procesable_en_pausa(self) -> bool:
@@ -112,14 +181,9 @@ class CuentaGlosasPrincipal:
         Returns:
             TipoProcesabilidad: Tipo de procesabilidad
         """
-        if self.estado == EstadoCuenta.COMPLETADO:
-            return TipoProcesabilidad.COMPLETADO
-        elif self.estado == EstadoCuenta.FALLA_TOTAL or self.intentos >= 5:
-            return TipoProcesabilidad.NO_PROCESABLE
-        elif self.estado in [EstadoCuenta.FALLIDO, EstadoCuenta.EN_PROCESO]:
-            return TipoProcesabilidad.PROCESABLE
-        else:
-            return TipoProcesabilidad.OTRO
+        return _PROCESABILIDAD_TABLE.get(
+            (self.estado, self.intentos >= 5), TipoProcesabilidad.OTRO
+        )
     
     def incrementar_intentos(self) -> None:
         """
@@ -158,7 +222,8 @@ class CuentaGlosasPrincipal:
             f"(intentos: {self.intentos}, procesabilidad: {procesabilidad.value})"
         )
 
-@dataclass
+@_dataclass_con_dict
+@dataclass(slots=True)
 class GlosaItemDetalle:
     """
     Modelo de datos para glosas individuales dentro de una cuenta.
@@ -184,53 +249,14 @@ class GlosaItemDetalle:
     respuesta_enviada: str = ""           # Respuesta que se envió
     archivo_subido: str = ""              # Path del PDF subido
     error_procesamiento: str = ""         # Si hubo error, descripción
-    
-    def to_dict(self) -> dict:
-        """Convierte el objeto a diccionario para BD."""
-        return {
-            'id': self.id,
-            'cuenta_principal_id': self.cuenta_principal_id,
-            'id_glosa': self.id_glosa,
-            'id_item': self.id_item,
-            'descripcion_item': self.descripcion_item,
-            'tipo': self.tipo,
-            'descripcion': self.descripcion,
-            'justificacion': self.justificacion,
-            'valor_glosado': self.valor_glosado,
-            'estado_original': self.estado_original,
-            'es_procesable': self.es_procesable,
-            'fue_procesado': self.fue_procesado,
-            'fecha_procesamiento': self.fecha_procesamiento,
-            'respuesta_enviada': self.respuesta_enviada,
-            'archivo_subido': self.archivo_subido,
-            'error_procesamiento': self.error_procesamiento
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'GlosaItemDetalle':
-        """Crea una instancia desde diccionario de BD."""
-        return cls(
-            id=data.get('id'),
-            cuenta_principal_id=data.get('cuenta_principal_id', 0),
-            id_glosa=data.get('id_glosa', ''),
-            id_item=data.get('id_item', ''),
-            descripcion_item=data.get('descripcion_item', ''),
-            tipo=data.get('tipo', ''),
-            descripcion=data.get('descripcion', ''),
-            justificacion=data.get('justificacion', ''),
-            valor_glosado=data.get('valor_glosado', 0.0),
-            estado_original=data.get('estado_original', ''),
-            es_procesable=data.get('es_procesable', False),
-            fue_procesado=data.get('fue_procesado', False),
-            fecha_procesamiento=data.get('fecha_procesamiento'),
-            respuesta_enviada=data.get('respuesta_enviada', ''),
-            archivo_subido=data.get('archivo_subido', ''),
-            error_procesamiento=data.get('error_procesamiento', '')
-        )
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EstadisticasEnPausa:
     """
     Modelo para estadísticas específicas del módulo EN PAUSA.
+    
+    Es una foto inmutable: la tasa y el resumen se calculan una sola vez al
+    crearla y los refrescos de la interfaz solo los leen.
     """
     total_fallidas: int = 0
     total_en_proceso: int = 0
@@ -238,23 +264,32 @@ class EstadisticasEnPausa:
     total_procesables: int = 0
     total_no_procesables: int = 0
     total_recuperadas_hoy: int = 0
+    _tasa_recuperacion: float = field(init=False, repr=False, compare=False)
+    _resumen: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        total_intentadas = self.total_fallidas + self.total_en_proceso
+        tasa = (
+            (self.total_recuperadas_hoy / total_intentadas) * 100
+            if total_intentadas else 0.0
+        )
+        # frozen: los campos calculados se asignan saltando __setattr__
+        object.__setattr__(self, '_tasa_recuperacion', tasa)
+        object.__setattr__(self, '_resumen', (
+            f"EN PAUSA: {self.total_procesables} procesables, "
+            f"{self.total_falla_total} falla total, "
+            f"tasa recuperación: {tasa:.1f}%"
+        ))
     
     def get_tasa_recuperacion(self) -> float:
         """Calcula la tasa de recuperación."""
-        total_intentadas = self.total_fallidas + self.total_en_proceso
-        if total_intentadas == 0:
-            return 0.0
-        return (self.total_recuperadas_hoy / total_intentadas) * 100
+        return self._tasa_recuperacion
     
     def get_resumen(self) -> str:
         """Obtiene resumen de estadísticas."""
-        return (
-            f"EN PAUSA: {self.total_procesables} procesables, "
-            f"{self.total_falla_total} falla total, "
-            f"tasa recuperación: {self.get_tasa_recuperacion():.1f}%"
-        )
+        return self._resumen
 
-@dataclass 
+@dataclass(slots=True)
 class ResultadoReprocesamiento:
     """
     Modelo para resultados de reprocesamiento EN PAUSA.
@@ -6,21 +6,33 @@ import os
 import sys
 from pathlib import Path
 
+# La corrección solo hace falta una vez por proceso
+_PATCHED = False
+
 def fix_dll_paths():
     """Corrige las rutas de DLLs para PyInstaller onefile."""
+    global _PATCHED
+    if _PATCHED:
+        return
+    
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         # Estamos en PyInstaller onefile
         bundle_dir = Path(sys._MEIPASS)
         
-        # Agregar directorio bundle al PATH
-        if str(bundle_dir) not in os.environ.get('PATH', ''):
-            os.environ['PATH'] = str(bundle_dir) + os.pathsep + os.environ.get('PATH', '')
+        # Agregar directorio bundle al PATH (siempre se antepone: basta
+        # con mirar el inicio en lugar de buscar en todo el PATH)
+        prefijo = str(bundle_dir) + os.pathsep
+        path = os.environ.get('PATH', '')
+        if not path.startswith(prefijo):
+            os.environ['PATH'] = prefijo + path
         
         # Configurar Playwright específicamente
         os.environ["PLAYWRIGHT_BROWSERS_PATH"] = str(bundle_dir)
         os.environ["PLAYWRIGHT_SKIP_BROWSER_DOWNLOAD"] = "1"
         
         print(f"🔧 DLL paths corregidos: {bundle_dir}")
+    
+    _PATCHED = True
 
 # Ejecutar corrección automáticamente
 fix_dll_paths()
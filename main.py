@@ -1,32 +1,51 @@
 import sys
 import asyncio
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QTimer
-from ui.main_window import MainWindow
-from database.db_manager import DatabaseManager
-from utils.logger import setup_logger
 
 def main():
     """
     Función principal de la aplicación.
-    Inicializa la base de datos, configura logging y lanza la interfaz.
+    Configura logging, lanza la interfaz e inicializa la base de datos.
+    
+    Los módulos de la interfaz se importan dentro de la función: la pantalla
+    de inicio aparece en cuanto existe QApplication, mientras se cargan
+    MainWindow y sus dependencias (playwright, widgets de glosas, etc.).
     """
-    # Configurar logging
+    from PySide6.QtWidgets import QApplication, QSplashScreen
+    from PySide6.QtCore import Qt, QTimer
+    from PySide6.QtGui import QPixmap, QColor
+    from utils.logger import setup_logger
+    
+    # Configurar logging (antes de crear widgets: setup_logger limpia los
+    # handlers del logger raíz, incluido el de LogWidget)
     logger = setup_logger()
     logger.info("Iniciando BootGestor...")
     
-    # Inicializar base de datos
-    db_manager = DatabaseManager()
-    db_manager.create_tables()
-    logger.info("Base de datos inicializada correctamente")
-    
     # Crear aplicación Qt
     app = QApplication(sys.argv)
     
+    # Pantalla de inicio mientras se importa y construye la ventana
+    pixmap = QPixmap(400, 120)
+    pixmap.fill(QColor("#1e1e1e"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "Iniciando BootGestor...",
+        Qt.AlignmentFlag.AlignCenter,
+        QColor("#ffffff")
+    )
+    splash.show()
+    app.processEvents()
+    
+    from ui.main_window import MainWindow
+    
     # Crear y mostrar ventana principal
     window = MainWindow()
     window.resize(1200, 990)  # <-- Añade esta línea para aumentar el tamaño
     window.show()
+    splash.finish(window)
+    
+    # La base de datos se inicializa en segundo plano una vez que la
+    # ventana ya se pintó
+    QTimer.singleShot(0, window.init_backend)
     
     logger.info("Aplicación iniciada correctamente")
     
@@ -1,11 +1,55 @@
 from typing import List
-from PySide6.QtWidgets import (QTableWidget, QTableWidgetItem, QHeaderView,
+from PySide6.QtWidgets import (QTableView, QHeaderView,
                             QAbstractItemView, QMenu, QMessageBox)
-from PySide6.QtCore import Qt, Signal as pyqtSignal
+from PySide6.QtCore import (Qt, Signal as pyqtSignal, QAbstractTableModel,
+                            QModelIndex, QSortFilterProxyModel)
 from PySide6.QtGui import QAction
 from database.models import Cliente
 
-class ClientTable(QTableWidget):
+class ClientTableModel(QAbstractTableModel):
+    """
+    Modelo de la tabla de clientes.
+    Lee cada celda de la lista de Cliente al pintarla, sin crear un
+    QTableWidgetItem por celda.
+    """
+    
+    HEADERS = ('ID', 'Nombre', 'NIT', 'Correo', 'Teléfono')
+    ATRIBUTOS = ('id', 'nombre', 'nit', 'correo', 'telefono')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clients: List[Cliente] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.clients)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        # El ID se entrega como int: el proxy lo ordena numéricamente
+        # (2 < 10) y no hay que convertirlo a texto por fila
+        return getattr(self.clients[index.row()], self.ATRIBUTOS[index.column()])
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def set_clients(self, clients: List[Cliente]):
+        """
+        Reemplaza la lista de clientes.
+        
+        Args:
+            clients (List[Cliente]): Lista de clientes a mostrar
+        """
+        self.beginResetModel()
+        self.clients = clients
+        self.endResetModel()
+
+class ClientTable(QTableView):
     """
     Tabla para mostrar y gestionar clientes.
     Proporciona funcionalidad CRUD básica para clientes.
@@ -18,16 +62,24 @@ class ClientTable(QTableWidget):
     
     def __init__(self):
         super().__init__()
-        self.clients: List[Cliente] = []
+        self._model = ClientTableModel(self)
+        
+        # El ordenamiento lo hace el proxy: el modelo conserva el orden
+        # original de self.clients
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self.setModel(self._proxy)
+        
         self.setup_ui()
         self.setup_context_menu()
+    
+    @property
+    def clients(self) -> List[Cliente]:
+        """Clientes cargados en la tabla, en el orden de carga."""
+        return self._model.clients
         
     def setup_ui(self):
         """Configura la interfaz de la tabla."""
-        # Configurar columnas
-        self.setColumnCount(5)
-        self.setHorizontalHeaderLabels(['ID', 'Nombre', 'NIT', 'Correo', 'Teléfono'])
-        
         # Configurar comportamiento
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -48,8 +100,8 @@ class ClientTable(QTableWidget):
         self.setColumnWidth(4, 120)  # Teléfono
         
         # Conectar señales
-        self.itemSelectionChanged.connect(self.on_selection_changed)
-        self.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.doubleClicked.connect(self.on_item_double_clicked)
         
     def setup_context_menu(self):
         """Configura el menú contextual."""
@@ -58,7 +110,7 @@ class ClientTable(QTableWidget):
         
     def show_context_menu(self, position):
         """Muestra el menú contextual."""
-        if self.itemAt(position) is None:
+        if not self.indexAt(position).isValid():
             return
             
         menu = QMenu(self)
@@ -80,19 +132,9 @@ class ClientTable(QTableWidget):
         Args:
             clients (List[Cliente]): Lista de clientes a mostrar
         """
-        self.clients = clients
-        self.setRowCount(len(clients))
-        
-        for row, client in enumerate(clients):
-            self.setItem(row, 0, QTableWidgetItem(str(client.id)))
-            self.setItem(row, 1, QTableWidgetItem(client.nombre))
-            self.setItem(row, 2, QTableWidgetItem(client.nit))
-            self.setItem(row, 3, QTableWidgetItem(client.correo))
-            self.setItem(row, 4, QTableWidgetItem(client.telefono))
-            
-            # Hacer que el ID no sea editable
-            id_item = self.item(row, 0)
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        # Un solo reset del modelo: la vista se repinta y el proxy ordena
+        # una vez, sin objetos por celda
+        self._model.set_clients(clients)
     
     def get_selected_client(self) -> Cliente:
         """
@@ -101,7 +143,13 @@ class ClientTable(QTableWidget):
         Returns:
             Cliente: Cliente seleccionado o None si no hay selección
         """
-        current_row = self.currentRow()
+        selected = self.selectionModel().selectedRows()
+        if not selected:
+            return None
+        
+        # La fila de la vista es la del proxy (ordenada): se traduce a la
+        # fila de self.clients
+        current_row = self._proxy.mapToSource(selected[0]).row()
         if current_row >= 0 and current_row < len(self.clients):
             return self.clients[current_row]
         return None
@@ -112,7 +160,7 @@ class ClientTable(QTableWidget):
         if client:
             self.client_selected.emit(client)
     
-    def on_item_double_clicked(self, item):
+    def on_item_double_clicked(self, index):
         """Maneja el doble clic en un elemento."""
         client = self.get_selected_client()
         if client:
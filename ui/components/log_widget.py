@@ -1,7 +1,38 @@
 import logging
-from PySide6.QtWidgets import QTextEdit
-from PySide6.QtCore import Signal as pyqtSignal, QObject
-from PySide6.QtGui import QTextCursor, QColor
+from collections import deque
+from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtCore import Signal as pyqtSignal, QObject, QTimer
+from PySide6.QtGui import QTextCursor, QColor, QTextCharFormat
+
+class _SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter que reutiliza la hora ya formateada mientras no cambie el segundo.
+    
+    Con datefmt sin milisegundos todos los registros de un mismo segundo
+    tienen la misma hora: time.strftime se llama una vez por segundo y no
+    una por registro.
+    """
+    
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        # (segundo, hora formateada) en una sola tupla: se reemplaza de una
+        # vez y los handlers de otros hilos nunca leen un par mezclado
+        self._cache = (None, '')
+    
+    def formatTime(self, record, datefmt=None):
+        segundo, hora = self._cache
+        actual = int(record.created)
+        if actual != segundo:
+            hora = super().formatTime(record, datefmt)
+            self._cache = (actual, hora)
+        return hora
+
+# Formato de la consola, compartido por todos los LogWidget. Solo la hora,
+# sin milisegundos: la consola no necesita la fecha
+_LOG_FORMATTER = _SecondCachedFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
 
 class LogSignalEmitter(QObject):
     """Emisor de señales para logs thread-safe."""
@@ -20,12 +51,31 @@ class LogHandler(logging.Handler):
         level = record.levelname
         self.signal_emitter.log_signal.emit(log_entry, level)
 
-class LogWidget(QTextEdit):
+def _formato_color(color: str) -> QTextCharFormat:
+    """Crea el formato de texto con el color de un nivel de log."""
+    text_format = QTextCharFormat()
+    text_format.setForeground(QColor(color))
+    return text_format
+
+class LogWidget(QPlainTextEdit):
     """
     Widget que muestra logs en tiempo real.
     Proporciona una consola visual para el seguimiento de operaciones.
     """
     
+    # Color según nivel, construidos una sola vez para todos los mensajes
+    _COLORS = {
+        'DEBUG': _formato_color('#888888'),
+        'INFO': _formato_color('#ffffff'),
+        'WARNING': _formato_color('#ffaa00'),
+        'ERROR': _formato_color('#ff4444'),
+        'CRITICAL': _formato_color('#ff0000')
+    }
+    _DEFAULT_COLOR = _COLORS['INFO']
+    
+    # Líneas que conserva la consola (y el buffer mientras está oculta)
+    MAX_LINES = 1000
+    
     def __init__(self):
         super().__init__()
         self.setup_ui()
@@ -35,15 +85,11 @@ class LogWidget(QTextEdit):
         """Configura la interfaz del widget."""
         self.setReadOnly(True)
         
-        # Configurar límite de líneas (alternativa compatible)
-        try:
-            self.setMaximumBlockCount(1000)  # Limitar líneas para rendimiento
-        except AttributeError:
-            # Alternativa si setMaximumBlockCount no está disponible
-            self.max_lines = 1000
+        # Qt descarta las líneas más antiguas al pasar el límite
+        self.setMaximumBlockCount(self.MAX_LINES)  # Limitar líneas para rendimiento
             
         self.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #ffffff;
                 font-family: 'Courier New', monospace;
@@ -55,70 +101,91 @@ class LogWidget(QTextEdit):
         
     def setup_logging(self):
         """Configura el sistema de logging para este widget."""
+        # Los mensajes se acumulan y se pintan juntos cada 50 ms: una
+        # ráfaga de logs es una sola edición del documento, no una por línea.
+        # Mientras el widget está oculto solo se acumulan, hasta MAX_LINES:
+        # las más antiguas las descartaría igualmente el documento
+        self._buffer = deque(maxlen=self.MAX_LINES)
+        self._oculto = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush)
+        
         self.signal_emitter = LogSignalEmitter()
         self.signal_emitter.log_signal.connect(self.append_log)
         
         # Crear handler personalizado
         self.log_handler = LogHandler(self.signal_emitter)
-        self.log_handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        )
+        self.log_handler.setFormatter(_LOG_FORMATTER)
         
-        # Agregar handler al logger principal
+        # Agregar handler al logger principal. Queda agregado aunque el
+        # widget se oculte (otra pestaña o ventana minimizada): ningún
+        # registro se pierde, solo se deja de pintar hasta volver a mostrarse
         root_logger = logging.getLogger()
         root_logger.addHandler(self.log_handler)
     
+    def showEvent(self, event):
+        """Pinta los logs acumulados mientras el widget estaba oculto."""
+        super().showEvent(event)
+        self._oculto = False
+        if self._buffer and not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def hideEvent(self, event):
+        """Deja de pintar logs mientras el widget está oculto."""
+        self._oculto = True
+        self._flush_timer.stop()
+        super().hideEvent(event)
+    
     def append_log(self, message: str, level: str):
         """
         Agrega un mensaje de log al widget.
         
+        El mensaje se pinta en el siguiente vaciado del buffer (máx. 50 ms),
+        o al volver a mostrarse el widget si está oculto.
+        
         Args:
             message (str): Mensaje a mostrar
             level (str): Nivel del log (INFO, ERROR, etc.)
         """
-        # Configurar color según nivel
-        color_map = {
-            'DEBUG': '#888888',
-            'INFO': '#ffffff',
-            'WARNING': '#ffaa00',
-            'ERROR': '#ff4444',
-            'CRITICAL': '#ff0000'
-        }
+        self._buffer.append((message, level))
+        if not self._oculto and not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush(self):
+        """Pinta de una vez los mensajes acumulados en el buffer."""
+        if not self._buffer:
+            return
         
-        color = color_map.get(level, '#ffffff')
+        # Un bloque por mensaje (igual que append), todos dentro de una sola
+        # edición: el documento se maqueta una vez por vaciado
+        # Solo se sigue el final si el usuario no se desplazó hacia arriba
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
         
-        # Agregar mensaje con color
-        self.setTextColor(QColor(color))
-        self.append(message)
+        document = self.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        
+        first = document.isEmpty()
+        while self._buffer:
+            message, level = self._buffer.popleft()
+            
+            # Agregar mensaje con color
+            if not first:
+                cursor.insertBlock()
+            cursor.insertText(message, self._COLORS.get(level, self._DEFAULT_COLOR))
+            first = False
         
-        # Limitar líneas manualmente si es necesario
-        if hasattr(self, 'max_lines'):
-            self._limit_lines()
+        cursor.endEditBlock()
         
         # Scroll automático al final
-        cursor = self.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.setTextCursor(cursor)
-    
-    def _limit_lines(self):
-        """Limita el número de líneas en el widget manualmente."""
-        try:
-            document = self.document()
-            if document.blockCount() > self.max_lines:
-                # Obtener el cursor al inicio del documento
-                cursor = QTextCursor(document)
-                cursor.movePosition(QTextCursor.MoveOperation.Start)
-                
-                # Seleccionar y eliminar líneas excedentes
-                lines_to_remove = document.blockCount() - self.max_lines
-                for _ in range(lines_to_remove):
-                    cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
-                    cursor.removeSelectedText()
-                    cursor.deleteChar()  # Eliminar el salto de línea
-        except Exception:
-            # Si hay algún error, no hacer nada crítico
-            pass
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
     
     def clear_logs(self):
         """Limpia todos los logs del widget."""
+        self._buffer.clear()
         self.clear()
\ No newline at end of file
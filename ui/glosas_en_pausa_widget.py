@@ -1,12 +1,13 @@
 # ui/glosas_en_pausa_widget.py
 import asyncio
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                             QGroupBox, QLineEdit, QLabel, QProgressBar,
                             QSplitter, QMessageBox, QTableWidget, QTableWidgetItem,
                             QHeaderView, QAbstractItemView)
 from PySide6.QtCore import Qt, QThread, QTimer, Signal as pyqtSignal
+from PySide6.QtGui import QFont
 from ui.components.log_widget import LogWidget
 from automation.web_scraper_glosas_en_pausa import WebScraperGlosasEnPausa
 from database.db_manager_glosas import DatabaseManagerGlosas
@@ -27,14 +28,20 @@ class GlosasEnPausaAutomationWorker(QThread):
     
     # Señales para tiempo real
     data_imported = pyqtSignal(int)
-    cuenta_processed = pyqtSignal(str, str)
+    cuentas_processed = pyqtSignal(list)  # Lote de (idcuenta, estado)
     tabla_refresh_needed = pyqtSignal()
     
+    # Coalescencia de actualizaciones por cuenta (una señal cross-thread por lote)
+    BATCH_MAX_UPDATES = 32
+    BATCH_FLUSH_SECONDS = 0.5
+    
     def __init__(self, username: str, password: str):
         super().__init__()
         self.username = username
         self.password = password
         self.logger = logging.getLogger(__name__)
+        self._pending_updates: List[Tuple[str, str]] = []
+        self._flush_handle = None
         
     def run(self):
         """Ejecuta la automatización de glosas EN PAUSA en el hilo de trabajo."""
@@ -51,25 +58,59 @@ class GlosasEnPausaAutomationWorker(QThread):
                 scraper.start_glosas_en_pausa_automation(self.username, self.password)
             )
             
+            self.flush_pending_updates()
             loop.close()
             
             self.automation_finished.emit(success)
             
         except Exception as e:
             self.logger.error(f"Error en worker de automatización de glosas EN PAUSA con herencia: {e}")
+            self.flush_pending_updates()
             self.automation_finished.emit(False)
         
     # Métodos para emitir signals
     def emit_data_imported(self, cantidad: int):
         """Emite signal cuando se importan datos."""
+        self.flush_pending_updates()
         self.data_imported.emit(cantidad)
     
     def emit_cuenta_processed(self, idcuenta: str, estado: str):
-        """Emite signal cuando se procesa una cuenta."""
-        self.cuenta_processed.emit(idcuenta, estado)
+        """
+        Encola la actualización de una cuenta.
+        Se envía a la UI en lote al llegar a BATCH_MAX_UPDATES o tras BATCH_FLUSH_SECONDS.
+        """
+        self._pending_updates.append((idcuenta, estado))
+        
+        if len(self._pending_updates) >= self.BATCH_MAX_UPDATES:
+            self.flush_pending_updates()
+            return
+        
+        if self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Sin event loop activo no hay temporizador: enviar de inmediato
+                self.flush_pending_updates()
+                return
+            self._flush_handle = loop.call_later(self.BATCH_FLUSH_SECONDS, self.flush_pending_updates)
+    
+    def emit_batch(self, updates: List[Tuple[str, str]]):
+        """Emite un único signal con un lote de actualizaciones (idcuenta, estado)."""
+        if updates:
+            self.cuentas_processed.emit(updates)
+    
+    def flush_pending_updates(self):
+        """Envía las actualizaciones de cuentas pendientes en un solo signal."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        updates, self._pending_updates = self._pending_updates, []
+        self.emit_batch(updates)
     
     def emit_tabla_refresh(self):
         """Emite signal para refrescar tabla."""
+        self.flush_pending_updates()
         self.tabla_refresh_needed.emit()
 
 class GlosasEnPausaStatsTable(QTableWidget):
@@ -77,9 +118,32 @@ class GlosasEnPausaStatsTable(QTableWidget):
     Tabla para mostrar estadísticas de cuentas EN PAUSA.
     """
     
+    ESTADOS_EN_PAUSA = ('FALLIDO', 'EN_PROCESO', 'FALLA_TOTAL')
+    ESTADO_COLORES = {
+        'FALLIDO': Qt.GlobalColor.red,
+        'EN_PROCESO': Qt.GlobalColor.yellow,
+    }
+    
+    # Límite de parámetros por consulta IN (SQLITE_MAX_VARIABLE_NUMBER antiguo)
+    MAX_PARAMETROS = 900
+    
+    # Columnas en el orden de la tabla
+    _SQL_COLUMNAS = """
+        SELECT idcuenta, proveedor, estado, glosas_encontradas,
+               glosas_procesadas, fecha_inicio, intentos, motivo_fallo
+        FROM cuenta_glosas_principal
+    """
+    
     def __init__(self):
         super().__init__()
         self.db_manager = DatabaseManagerGlosas()
+        
+        # idcuenta -> item de la columna ID; item.row() sigue a la fila
+        # aunque el usuario reordene la tabla
+        self._row_by_id: Dict[str, QTableWidgetItem] = {}
+        self._font_bold = QFont()
+        self._font_bold.setBold(True)
+        
         self.setup_ui()
         self.load_data()
         
@@ -118,53 +182,132 @@ class GlosasEnPausaStatsTable(QTableWidget):
         self.setColumnWidth(6, 70)   # Intentos
         
     def load_data(self):
-        """Carga SOLO las cuentas EN PAUSA (FALLIDAS y EN_PROCESO)."""
+        """Carga SOLO las cuentas EN PAUSA (FALLIDAS, EN_PROCESO y FALLA_TOTAL)."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT idcuenta, proveedor, estado, glosas_encontradas, 
-                           glosas_procesadas, fecha_inicio, intentos, motivo_fallo
-                    FROM cuenta_glosas_principal 
-<<<<<<< HEAD
+                cursor = conn.execute(self._SQL_COLUMNAS + """
                     WHERE estado IN ('FALLIDO', 'EN_PROCESO', 'FALLA_TOTAL')
-=======
-                    WHERE estado IN ('FALLIDO', 'EN_PROCESO') 
->>>>>>> develop
                     ORDER BY intentos DESC, fecha_inicio DESC
                 """)
-                
                 rows = cursor.fetchall()
+            
+            self.setSortingEnabled(False)
+            self.setUpdatesEnabled(False)
+            try:
+                self.setRowCount(0)
                 self.setRowCount(len(rows))
+                self._row_by_id.clear()
                 
                 for row_idx, row in enumerate(rows):
-                    self.setItem(row_idx, 0, QTableWidgetItem(str(row['idcuenta'])))
-                    self.setItem(row_idx, 1, QTableWidgetItem(row['proveedor'] or ''))
-                    
-                    # Colorear estado según valor
-                    estado_item = QTableWidgetItem(row['estado'])
-                    if row['estado'] == 'FALLIDO':
-                        estado_item.setBackground(Qt.GlobalColor.red)
-                    elif row['estado'] == 'EN_PROCESO':
-                        estado_item.setBackground(Qt.GlobalColor.yellow)
-                    
-                    self.setItem(row_idx, 2, estado_item)
-                    self.setItem(row_idx, 3, QTableWidgetItem(str(row['glosas_encontradas'])))
-                    self.setItem(row_idx, 4, QTableWidgetItem(str(row['glosas_procesadas'])))
-                    self.setItem(row_idx, 5, QTableWidgetItem(row['fecha_inicio'] or ''))
-                    
-                    # Colorear intentos según cantidad
-                    intentos_item = QTableWidgetItem(str(row['intentos']))
-                    if row['intentos'] >= 5:
-                        intentos_item.setBackground(Qt.GlobalColor.darkRed)
-                        intentos_item.setStyleSheet("color: white; font-weight: bold;")
-                    elif row['intentos'] >= 3:
-                        intentos_item.setBackground(Qt.GlobalColor.yellow)
-                    
-                    self.setItem(row_idx, 6, intentos_item)
-                    self.setItem(row_idx, 7, QTableWidgetItem(row['motivo_fallo'] or ''))
+                    self._set_row(row_idx, row)
+            finally:
+                self.setUpdatesEnabled(True)
+                self.setSortingEnabled(True)
                     
         except Exception as e:
             logging.getLogger(__name__).error(f"Error cargando datos de tabla EN PAUSA: {e}")
+    
+    def apply_updates(self, updates: List[Tuple[str, str]]):
+        """
+        Actualiza solo las filas de las cuentas indicadas, sin recargar la tabla.
+        
+        Las filas existentes conservan sus items (se cambia texto y color),
+        las cuentas nuevas EN PAUSA se insertan arriba y las que salieron de
+        EN PAUSA se quitan.
+        
+        Args:
+            updates (List[Tuple[str, str]]): Lote de (idcuenta, estado)
+        """
+        # Sin repetir cuentas: una cuenta puede llegar varias veces por lote
+        ids = list(dict.fromkeys(str(idcuenta) for idcuenta, _ in updates))
+        if not ids:
+            return
+        
+        try:
+            rows = []
+            with self.db_manager.get_connection() as conn:
+                for i in range(0, len(ids), self.MAX_PARAMETROS):
+                    bloque = ids[i:i + self.MAX_PARAMETROS]
+                    marcadores = ', '.join('?' * len(bloque))
+                    cursor = conn.execute(
+                        f"{self._SQL_COLUMNAS} WHERE idcuenta IN ({marcadores})",
+                        bloque
+                    )
+                    rows.extend(cursor.fetchall())
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Error actualizando tabla EN PAUSA: {e}")
+            return
+        
+        self.setSortingEnabled(False)
+        self.setUpdatesEnabled(False)
+        try:
+            en_pausa = set()
+            for row in rows:
+                idcuenta = str(row[0])
+                if row[2] not in self.ESTADOS_EN_PAUSA:
+                    continue
+                
+                en_pausa.add(idcuenta)
+                item_id = self._row_by_id.get(idcuenta)
+                if item_id is not None:
+                    self._set_row(item_id.row(), row)
+                else:
+                    self.insertRow(0)
+                    self._set_row(0, row)
+            
+            # Cuentas recuperadas (o borradas): ya no están EN PAUSA
+            for idcuenta in ids:
+                if idcuenta not in en_pausa and idcuenta in self._row_by_id:
+                    self.removeRow(self._row_by_id.pop(idcuenta).row())
+        finally:
+            self.setUpdatesEnabled(True)
+            self.setSortingEnabled(True)
+    
+    def _set_row(self, row_idx: int, row):
+        """
+        Escribe una cuenta en la fila indicada.
+        Reutiliza los items que ya existan en la fila y crea los que falten.
+        """
+        idcuenta, proveedor, estado, encontradas, procesadas, fecha_inicio, intentos, motivo_fallo = row
+        intentos = intentos or 0
+        textos = (
+            str(idcuenta), proveedor or '', estado, str(encontradas),
+            str(procesadas), fecha_inicio or '', str(intentos), motivo_fallo or ''
+        )
+        
+        items = []
+        for col, texto in enumerate(textos):
+            item = self.item(row_idx, col)
+            if item is None:
+                item = QTableWidgetItem(texto)
+                self.setItem(row_idx, col, item)
+            else:
+                item.setText(texto)
+            items.append(item)
+        
+        self._row_by_id[str(idcuenta)] = items[0]
+        
+        # Colorear estado según valor
+        color_estado = self.ESTADO_COLORES.get(estado)
+        if color_estado is not None:
+            items[2].setBackground(color_estado)
+        else:
+            items[2].setData(Qt.ItemDataRole.BackgroundRole, None)
+        
+        # Colorear intentos según cantidad
+        intentos_item = items[6]
+        if intentos >= 5:
+            intentos_item.setBackground(Qt.GlobalColor.darkRed)
+            intentos_item.setForeground(Qt.GlobalColor.white)
+            intentos_item.setFont(self._font_bold)
+            return
+        
+        if intentos >= 3:
+            intentos_item.setBackground(Qt.GlobalColor.yellow)
+        else:
+            intentos_item.setData(Qt.ItemDataRole.BackgroundRole, None)
+        intentos_item.setData(Qt.ItemDataRole.ForegroundRole, None)
+        intentos_item.setData(Qt.ItemDataRole.FontRole, None)
 
 class GlosasEnPausaWidget(QWidget):
     """
@@ -178,6 +321,19 @@ class GlosasEnPausaWidget(QWidget):
         self.automation_worker = None
         self.db_manager = DatabaseManagerGlosas()
         
+        # Conexión persistente del hilo de la interfaz (la abre una vez el
+        # gestor y la reutiliza): las estadísticas no abren una por consulta
+        self._conn = self.db_manager.get_connection()
+        
+        # Las señales del worker se acumulan y se aplican juntas a los
+        # 150 ms: una ráfaga de lotes es una sola consulta y un solo repintado
+        self._pending_updates: List[Tuple[str, str]] = []
+        self._tabla_refresh_pending = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(150)
+        self._flush_timer.timeout.connect(self._flush_updates)
+        
         self.setup_ui()
         self.connect_signals()
         self.update_stats()
@@ -414,7 +570,7 @@ class GlosasEnPausaWidget(QWidget):
         self.automation_worker.automation_finished.connect(self.on_automation_finished)
         self.automation_worker.progress_updated.connect(self.on_progress_updated)
         self.automation_worker.data_imported.connect(self.on_data_imported)
-        self.automation_worker.cuenta_processed.connect(self.on_cuenta_processed)
+        self.automation_worker.cuentas_processed.connect(self.on_cuentas_processed)
         self.automation_worker.tabla_refresh_needed.connect(self.on_tabla_refresh_needed)
         
         self.automation_worker.start()
@@ -426,30 +582,58 @@ class GlosasEnPausaWidget(QWidget):
         self.stats_table.load_data()
         self.status_label.setText(f"✅ Identificadas {cantidad} cuentas EN PAUSA - Iniciando reprocesamiento...")
     
-    def on_cuenta_processed(self, idcuenta: str, estado: str):
-        """Se ejecuta cuando se procesa una cuenta EN PAUSA."""
+    def on_cuentas_processed(self, updates: list):
+        """Se ejecuta cuando llega un lote de cuentas EN PAUSA procesadas."""
         emoji_map = {
             "COMPLETADO": "✅",
             "FALLIDO": "❌", 
             "EN_PROCESO": "🔄"
         }
-        emoji = emoji_map.get(estado, "❓")
         
-        self.logger.info(f"📊 Signal recibido: {emoji} Cuenta {idcuenta} -> {estado}")
+        for idcuenta, estado in updates:
+            emoji = emoji_map.get(estado, "❓")
+            self.logger.info(f"📊 Signal recibido: {emoji} Cuenta {idcuenta} -> {estado}")
         
-        self.update_stats()
-        
-        # Actualizar mensaje de estado con progreso
-        total_recuperadas = self.get_total_recuperadas()
-        total_en_pausa = self.get_total_en_pausa()
-        
-        self.status_label.setText(f"🔄 Reprocesando... (✅{total_recuperadas} recuperadas, ⏳{total_en_pausa} EN PAUSA)")
+        self._pending_updates.extend(updates)
+        self._schedule_flush()
     
     def on_tabla_refresh_needed(self):
         """Se ejecuta cuando necesita refrescar toda la interfaz."""
         self.logger.info("📊 Signal recibido: Refrescando interfaz EN PAUSA completa")
-        self.stats_table.load_data()
-        self.update_stats()
+        self._tabla_refresh_pending = True
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Programa el vaciado de actualizaciones si no hay uno pendiente."""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _cancel_pending_flush(self):
+        """Descarta las actualizaciones acumuladas (se va a recargar todo)."""
+        self._flush_timer.stop()
+        self._pending_updates.clear()
+        self._tabla_refresh_pending = False
+    
+    def _flush_updates(self):
+        """Aplica de una vez las actualizaciones acumuladas desde el último vaciado."""
+        updates, self._pending_updates = self._pending_updates, []
+        refrescar_tabla, self._tabla_refresh_pending = self._tabla_refresh_pending, False
+        
+        if refrescar_tabla:
+            self.stats_table.load_data()
+        elif updates:
+            # Solo las filas de las cuentas que cambiaron
+            self.stats_table.apply_updates(updates)
+        
+        # Una sola consulta de estadísticas por vaciado, también para el mensaje
+        stats = self.update_stats()
+        
+        if updates:
+            # Actualizar mensaje de estado con progreso
+            self.status_label.setText(
+                f"🔄 Reprocesando... (✅{stats['recuperadas']} recuperadas, "
+                f"⏳{stats['total_en_pausa']} EN PAUSA)"
+            )
         
     def stop_automation(self):
         """Detiene el proceso de automatización."""
@@ -464,8 +648,11 @@ class GlosasEnPausaWidget(QWidget):
         """Maneja la finalización del reprocesamiento."""
         self.reset_ui_state()
         
-        total_recuperadas = self.get_total_recuperadas()
-        total_en_pausa = self.get_total_en_pausa()
+        # La recarga final ya incluye lo que quedara por aplicar
+        self._cancel_pending_flush()
+        stats = self._fetch_stats()
+        total_recuperadas = stats['recuperadas']
+        total_en_pausa = stats['total_en_pausa']
         
         if success:
             self.status_label.setText(f"✅ Reprocesamiento completado - {total_recuperadas} recuperadas")
@@ -484,7 +671,9 @@ class GlosasEnPausaWidget(QWidget):
                 "El proceso de reprocesamiento falló. Revise los logs para más detalles."
             )
         
-        self.refresh_data()
+        # Los contadores leídos arriba siguen vigentes: solo falta la tabla
+        self.update_stats(stats)
+        self.stats_table.load_data()
     
     def on_progress_updated(self, value: int):
         """Actualiza la barra de progreso."""
@@ -505,58 +694,76 @@ class GlosasEnPausaWidget(QWidget):
         self.stats_table.load_data()
         self.logger.info("🔄 Datos de interfaz EN PAUSA actualizados")
     
-    def update_stats(self):
-        """Actualiza las estadísticas mostradas para cuentas EN PAUSA."""
+    def _fetch_stats(self) -> Dict[str, int]:
+        """
+        Obtiene en una sola consulta todos los contadores de cuentas EN PAUSA.
+        
+        Agrupa por (estado, intentos) y reparte los grupos en Python: una
+        pasada por el índice (estado, intentos) en lugar de una consulta por
+        contador.
+        
+        Returns:
+            Dict[str, int]: fallidas, en_proceso, total_en_pausa,
+            intentos_1_2, intentos_3_4, intentos_5_mas y recuperadas
+        """
+        stats = dict.fromkeys((
+            'fallidas', 'en_proceso', 'total_en_pausa', 'intentos_1_2',
+            'intentos_3_4', 'intentos_5_mas', 'recuperadas'
+        ), 0)
+        
         try:
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT 
-                        SUM(CASE WHEN estado = 'FALLIDO' THEN 1 ELSE 0 END) as fallidas,
-                        SUM(CASE WHEN estado = 'EN_PROCESO' THEN 1 ELSE 0 END) as en_proceso,
-                        SUM(CASE WHEN estado IN ('FALLIDO', 'EN_PROCESO') THEN 1 ELSE 0 END) as total_en_pausa,
-                        SUM(CASE WHEN estado IN ('FALLIDO', 'EN_PROCESO') AND COALESCE(intentos, 0) BETWEEN 1 AND 2 THEN 1 ELSE 0 END) as intentos_1_2,
-                        SUM(CASE WHEN estado IN ('FALLIDO', 'EN_PROCESO') AND COALESCE(intentos, 0) BETWEEN 3 AND 4 THEN 1 ELSE 0 END) as intentos_3_4,
-                        SUM(CASE WHEN estado IN ('FALLIDO', 'EN_PROCESO') AND COALESCE(intentos, 0) >= 5 THEN 1 ELSE 0 END) as intentos_5_mas
-                    FROM cuenta_glosas_principal
-                """)
-                
-                row = cursor.fetchone()
+            cursor = self._conn.execute("""
+                SELECT estado, intentos, COUNT(*)
+                FROM cuenta_glosas_principal
+                WHERE estado IN ('FALLIDO', 'EN_PROCESO', 'COMPLETADO')
+                GROUP BY estado, intentos
+            """)
+            
+            # Agrupar por la columna tal cual (sin COALESCE) deja que los
+            # grupos salgan en orden de idx_estado_intentos_fecha; los
+            # intentos NULL se cuentan como 0 aquí
+            for estado, intentos, count in cursor:
+                intentos = intentos or 0
+                if estado == 'COMPLETADO':
+                    stats['recuperadas'] += count
+                    continue
                 
-                # Actualizar labels
-                self.stats_labels['fallidas'].setText(f"❌ Fallidas: {row['fallidas'] or 0}")
-                self.stats_labels['en_proceso'].setText(f"🔄 En Proceso: {row['en_proceso'] or 0}")
-                self.stats_labels['total_en_pausa'].setText(f"⏳ Total EN PAUSA: {row['total_en_pausa'] or 0}")
-                self.stats_labels['intentos_1_2'].setText(f"🟡 Intentos 1-2: {row['intentos_1_2'] or 0}")
-                self.stats_labels['intentos_3_4'].setText(f"🟠 Intentos 3-4: {row['intentos_3_4'] or 0}")
-                self.stats_labels['intentos_5_mas'].setText(f"🔴 Intentos 5+: {row['intentos_5_mas'] or 0}")
+                stats['fallidas' if estado == 'FALLIDO' else 'en_proceso'] += count
+                stats['total_en_pausa'] += count
                 
+                if intentos >= 5:
+                    stats['intentos_5_mas'] += count
+                elif intentos >= 3:
+                    stats['intentos_3_4'] += count
+                elif intentos >= 1:
+                    stats['intentos_1_2'] += count
+                    
         except Exception as e:
-            self.logger.error(f"Error actualizando estadísticas EN PAUSA: {e}")
-    
-    def get_total_recuperadas(self) -> int:
-        """Obtiene total de cuentas recuperadas (COMPLETADAS) desde BD."""
-        try:
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT COUNT(*) as count 
-                    FROM cuenta_glosas_principal 
-                    WHERE estado = 'COMPLETADO'
-                """)
-                result = cursor.fetchone()
-                return result['count'] if result else 0
-        except Exception:
-            return 0
+            self.logger.error(f"Error obteniendo estadísticas EN PAUSA: {e}")
+        
+        return stats
     
-    def get_total_en_pausa(self) -> int:
-        """Obtiene total de cuentas EN PAUSA desde BD."""
-        try:
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT COUNT(*) as count 
-                    FROM cuenta_glosas_principal 
-                    WHERE estado IN ('FALLIDO', 'EN_PROCESO')
-                """)
-                result = cursor.fetchone()
-                return result['count'] if result else 0
-        except Exception:
-            return 0
\ No newline at end of file
+    def update_stats(self, stats: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+        """
+        Actualiza las estadísticas mostradas para cuentas EN PAUSA.
+        
+        Args:
+            stats (Dict[str, int], optional): Contadores ya leídos con
+                _fetch_stats; si no se pasan se consultan
+            
+        Returns:
+            Dict[str, int]: Los contadores mostrados, para reutilizarlos en
+            los mensajes de estado sin volver a consultar
+        """
+        if stats is None:
+            stats = self._fetch_stats()
+        
+        # Actualizar labels
+        self.stats_labels['fallidas'].setText(f"❌ Fallidas: {stats['fallidas']}")
+        self.stats_labels['en_proceso'].setText(f"🔄 En Proceso: {stats['en_proceso']}")
+        self.stats_labels['total_en_pausa'].setText(f"⏳ Total EN PAUSA: {stats['total_en_pausa']}")
+        self.stats_labels['intentos_1_2'].setText(f"🟡 Intentos 1-2: {stats['intentos_1_2']}")
+        self.stats_labels['intentos_3_4'].setText(f"🟠 Intentos 3-4: {stats['intentos_3_4']}")
+        self.stats_labels['intentos_5_mas'].setText(f"🔴 Intentos 5+: {stats['intentos_5_mas']}")
+        
+        return stats
\ No newline at end of file
@@ -101,36 +101,30 @@ class GlosasStatsTable(QTableWidget):
     def load_data(self):
         """Carga los datos de cuentas desde la base de datos."""
         try:
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT idcuenta, proveedor, estado, glosas_encontradas, 
-                           glosas_procesadas, fecha_inicio, motivo_fallo
-                    FROM cuenta_glosas_principal 
-                    ORDER BY fecha_inicio DESC
-                """)
+            # Tuplas planas: la tabla solo muestra, no hace falta el modelo
+            rows = self.db_manager.fetch_cuentas_rows()
+            self.setRowCount(len(rows))
+            
+            for row_idx, (idcuenta, proveedor, estado, glosas_encontradas,
+                          glosas_procesadas, fecha_inicio, motivo_fallo) in enumerate(rows):
+                self.setItem(row_idx, 0, QTableWidgetItem(str(idcuenta)))
+                self.setItem(row_idx, 1, QTableWidgetItem(proveedor or ''))
+                
+                # Colorear estado según valor
+                estado_item = QTableWidgetItem(estado)
+                if estado == 'COMPLETADO':
+                    estado_item.setBackground(Qt.GlobalColor.green)
+                elif estado == 'FALLIDO':
+                    estado_item.setBackground(Qt.GlobalColor.red)
+                elif estado == 'EN_PROCESO':
+                    estado_item.setBackground(Qt.GlobalColor.yellow)
                 
-                rows = cursor.fetchall()
-                self.setRowCount(len(rows))
+                self.setItem(row_idx, 2, estado_item)
+                self.setItem(row_idx, 3, QTableWidgetItem(str(glosas_encontradas)))
+                self.setItem(row_idx, 4, QTableWidgetItem(str(glosas_procesadas)))
+                self.setItem(row_idx, 5, QTableWidgetItem(fecha_inicio or ''))
+                self.setItem(row_idx, 6, QTableWidgetItem(motivo_fallo or ''))
                 
-                for row_idx, row in enumerate(rows):
-                    self.setItem(row_idx, 0, QTableWidgetItem(str(row['idcuenta'])))
-                    self.setItem(row_idx, 1, QTableWidgetItem(row['proveedor'] or ''))
-                    
-                    # Colorear estado según valor
-                    estado_item = QTableWidgetItem(row['estado'])
-                    if row['estado'] == 'COMPLETADO':
-                        estado_item.setBackground(Qt.GlobalColor.green)
-                    elif row['estado'] == 'FALLIDO':
-                        estado_item.setBackground(Qt.GlobalColor.red)
-                    elif row['estado'] == 'EN_PROCESO':
-                        estado_item.setBackground(Qt.GlobalColor.yellow)
-                    
-                    self.setItem(row_idx, 2, estado_item)
-                    self.setItem(row_idx, 3, QTableWidgetItem(str(row['glosas_encontradas'])))
-                    self.setItem(row_idx, 4, QTableWidgetItem(str(row['glosas_procesadas'])))
-                    self.setItem(row_idx, 5, QTableWidgetItem(row['fecha_inicio'] or ''))
-                    self.setItem(row_idx, 6, QTableWidgetItem(row['motivo_fallo'] or ''))
-                    
         except Exception as e:
             logging.getLogger(__name__).error(f"Error cargando datos de tabla: {e}")
 
@@ -3,7 +3,7 @@ import logging
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QMenuBar, QStatusBar, QStackedWidget, QPushButton,
                             QSplitter, QGroupBox, QMessageBox)
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThreadPool, Signal as pyqtSignal
 from PySide6.QtGui import QAction, QKeySequence
 from ui.glosas_widget import GlosasWidget
 from ui.glosas_en_pausa_widget import GlosasEnPausaWidget  # ✅ NUEVO IMPORT
@@ -23,6 +23,9 @@ class MainWindow(QMainWindow):
     ✅ ACTUALIZADO: Ahora incluye soporte para módulo "En Pausa"
     """
     
+    # Emitida desde el hilo del pool cuando la base de datos está lista
+    backend_ready = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(__name__)
@@ -40,7 +43,9 @@ class MainWindow(QMainWindow):
         self.setup_ui()
         self.setup_menu()
         self.setup_status_bar()
-        self.load_initial_data()
+        
+        # Los datos se cargan cuando init_backend termina de crear las tablas
+        self.backend_ready.connect(self.on_backend_ready)
         
         # Establecer vista inicial después de configurar todo
         self.switch_to_view(0)
@@ -333,10 +338,10 @@ class MainWindow(QMainWindow):
         # Indicar que es la versión mejorada CON En Pausa
         self.status_bar.showMessage("BootGestor v2.1 - Módulo: Gestión de Glosas (Con Reprocesamiento)")
         
-        # Timer para actualizar estado periódicamente
+        # Timer para actualizar estado periódicamente (arranca en
+        # on_backend_ready, cuando ya existen las tablas que consulta)
         self.status_timer = QTimer()
         self.status_timer.timeout.connect(self.update_status)
-        self.status_timer.start(5000)  # Actualizar cada 5 segundos
         
     def connect_signals(self):
         """Conecta las señales de los componentes."""
@@ -452,6 +457,30 @@ class MainWindow(QMainWindow):
                 f"No se pudo abrir la carpeta de logs: {str(e)}"
             )
     
+    def init_backend(self):
+        """
+        Inicializa la base de datos en un hilo del pool.
+        
+        Se llama con la ventana ya visible: create_tables no retrasa el
+        primer pintado. Al terminar se emite backend_ready y la carga de
+        datos sigue en el hilo de la interfaz.
+        """
+        QThreadPool.globalInstance().start(self._init_backend_worker)
+    
+    def _init_backend_worker(self):
+        """Crea las tablas (se ejecuta fuera del hilo de la interfaz)."""
+        try:
+            self.db_manager.create_tables()
+            self.logger.info("Base de datos inicializada correctamente")
+        except Exception as e:
+            self.logger.error(f"Error inicializando base de datos: {e}")
+        self.backend_ready.emit()
+    
+    def on_backend_ready(self):
+        """Carga los datos y activa la actualización del estado."""
+        self.load_initial_data()
+        self.status_timer.start(5000)  # Actualizar cada 5 segundos
+    
     def load_initial_data(self):
         """Carga los datos iniciales de la aplicación."""
         self.refresh_clients()
@@ -593,7 +622,8 @@ class MainWindow(QMainWindow):
     def update_status(self):
         """Actualiza la información de la barra de estado."""
         try:
-            client_count = len(self.db_manager.get_all_clients())
+            # COUNT(*) en SQLite: no se traen filas a Python cada 5 s
+            client_count = self.db_manager.count_clients()
             current_view = self.stacked_widget.currentIndex()
             view_names = {
                 0: "Gestión de Glosas (v2.1)", 
@@ -667,6 +697,8 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.logger.info("Cerrando aplicación BootGestor v2.1 con En Pausa")
+            if self.db_manager_glosas is not None:
+                self.db_manager_glosas.close()
             event.accept()
         else:
             event.ignore()
\ No newline at end of file
@@ -32,6 +32,14 @@ def setup_logger() -> logging.Logger:
     Returns:
         logging.Logger: Logger principal configurado
     """
+    # Ningún formato usa hilo, proceso ni archivo/línea de origen: sin
+    # estas banderas cada registro se crea sin consultarlos (y sin el
+    # findCaller que recorre la pila)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+    
     # Crear logger principal
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, Settings.LOG_LEVEL))